@@ -0,0 +1,25 @@
+"""
+Guard tests for the display HAL hot paths.
+
+The display adapters once walked frames with Image.getpixel — the
+canonical Pillow anti-pattern that cost tens of milliseconds per frame
+on the Pi Zero. The conversion now runs through Pillow's C layer, and
+this test keeps per-pixel access from creeping back in.
+"""
+
+from pathlib import Path
+
+DISPLAY_DIR = Path(__file__).parent.parent / "yoyopy" / "ui" / "display"
+
+
+def test_no_getpixel_in_display_modules():
+    """Per-pixel buffer access is forbidden in the display subsystem."""
+    offenders = []
+    for source in DISPLAY_DIR.rglob("*.py"):
+        if "getpixel(" in source.read_text():
+            offenders.append(str(source))
+
+    assert not offenders, (
+        f"getpixel() found in {offenders} - use Pillow C-layer operations "
+        "(point/paste/split/merge) instead of per-pixel access"
+    )
@@ -5,6 +5,7 @@ Provides interface to Mopidy music server for Spotify streaming
 and playlist management via HTTP JSON-RPC API.
 """
 
+import json
 import requests
 import time
 from typing import Optional, List, Dict, Any, Callable
@@ -12,6 +13,8 @@ from dataclasses import dataclass
 from threading import Thread, Event
 from loguru import logger
 
+from yoyopy.utils.logger import debug_enabled
+
 
 @dataclass
 class MopidyTrack:
@@ -102,8 +105,47 @@ class MopidyClient:
         self.poll_event = Event()
         self.polling = False
 
+        # Serialized request bodies, keyed by (method, frozen params).
+        # Polling calls repeat the exact same payload every cycle, so the
+        # bytes only need to be built once. JSON-RPC permits reusing id=1.
+        self._payload_cache: Dict[tuple, bytes] = {}
+
         logger.info(f"MopidyClient initialized ({host}:{port})")
 
+    def _serialize_payload(self, method: str, params: Optional[Dict]) -> bytes:
+        """
+        Serialize a JSON-RPC payload, reusing cached bytes when possible.
+
+        Args:
+            method: RPC method name
+            params: Optional parameters dict
+
+        Returns:
+            Encoded request body
+        """
+        try:
+            key = (method, frozenset(params.items()) if params else ())
+        except TypeError:
+            # Unhashable param values (e.g. lists of URIs) - skip the cache
+            key = None
+
+        if key is not None:
+            cached = self._payload_cache.get(key)
+            if cached is not None:
+                return cached
+
+        payload_bytes = json.dumps({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": method,
+            "params": params or {}
+        }).encode("utf-8")
+
+        if key is not None:
+            self._payload_cache[key] = payload_bytes
+
+        return payload_bytes
+
     def _rpc_call(self, method: str, params: Optional[Dict] = None) -> Any:
         """
         Make JSON-RPC call to Mopidy.
@@ -118,20 +160,13 @@ class MopidyClient:
         Raises:
             requests.RequestException: On connection/request error
         """
-        if params is None:
-            params = {}
-
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": method,
-            "params": params
-        }
+        payload_bytes = self._serialize_payload(method, params)
 
         try:
             response = requests.post(
                 self.base_url,
-                json=payload,
+                data=payload_bytes,
+                headers={"Content-Type": "application/json"},
                 timeout=self.timeout
             )
             response.raise_for_status()
@@ -266,7 +301,8 @@ class MopidyClient:
 
         try:
             result = self._rpc_call("core.mixer.set_volume", {"volume": volume})
-            logger.debug(f"Volume set to {volume}%")
+            if debug_enabled():
+                logger.debug(f"Volume set to {volume}%")
             return result is not None
         except Exception as e:
             logger.error(f"Failed to set volume: {e}")
@@ -371,7 +407,8 @@ class MopidyClient:
                 )
                 playlists.append(playlist)
 
-            logger.debug(f"Found {len(playlists)} playlists")
+            if debug_enabled():
+                logger.debug(f"Found {len(playlists)} playlists")
             return playlists
 
         except Exception as e:
@@ -470,7 +507,8 @@ class MopidyClient:
                         except Exception as e:
                             logger.error(f"Error in playback state change callback: {e}")
 
-                    logger.debug(f"Playback state changed: {old_state} → {playback_state}")
+                    if debug_enabled():
+                        logger.debug(f"Playback state changed: {old_state} → {playback_state}")
 
             except Exception as e:
                 logger.error(f"Error polling track changes: {e}")
@@ -5,14 +5,31 @@ Provides SIP/VoIP calling capability by interfacing with linphonec CLI.
 Handles registration, call management, and status monitoring.
 """
 
+import os
+import re
+import selectors
 import subprocess
 import threading
 import time
 from enum import Enum
-from typing import Optional, Callable, List
+from typing import Optional, Callable, Dict, List
 from dataclasses import dataclass
 from loguru import logger
 
+from yoyopy.utils.logger import debug_enabled
+
+
+# One pass covers the SIP address formats linphonec emits:
+# - Linphone 5.x: "New incoming call from [sip:user@domain]"
+# - Linphone 4.x: "Receiving new incoming call from <sip:user@domain>"
+# - Fallback:     "... from sip:user@domain"
+_CALLER_ADDRESS_RE = re.compile(
+    r"\[(?P<bracketed>sip:[^\]]+)\]"
+    r"|<(?P<angled>sip:[^>]+)>"
+    r"|from\s+(?P<bare>sip:[^\s,]+)",
+    re.IGNORECASE,
+)
+
 
 class RegistrationState(Enum):
     """SIP registration states."""
@@ -41,7 +58,7 @@ class CallState(Enum):
     END = "end"
 
 
-@dataclass
+@dataclass(slots=True)
 class VoIPConfig:
     """VoIP configuration."""
     sip_server: str = "sip.linphone.org"
@@ -110,6 +127,10 @@ class VoIPManager:
         self.call_state_callbacks: List[Callable[[CallState], None]] = []
         self.incoming_call_callbacks: List[Callable[[str, str], None]] = []  # (address, name)
 
+        # Encoded command bytes, cached per command string ("answer",
+        # "terminate", ...) so repeated sends skip the encode step
+        self._command_bytes: Dict[str, bytes] = {}
+
         # Monitor thread
         self.monitor_thread: Optional[threading.Thread] = None
         self.monitor_event = threading.Event()
@@ -132,7 +153,6 @@ class VoIPManager:
             return False
 
         try:
-            import os
             linphonerc_path = os.path.expanduser("~/.linphonerc")
 
             # Linphonerc configuration
@@ -231,15 +251,24 @@ mic_gain_db=10.0
 
             logger.info("Starting linphonec...")
 
-            # Start linphonec in daemon mode with pipe interface
-            self.process = subprocess.Popen(
-                [self.config.linphonec_path, "-d", "6"],  # -d 6 = debug level
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1
-            )
+            # Start linphonec in daemon mode with pipe interface.
+            # All I/O happens at the fd level (os.read/os.write), so the
+            # pipes stay binary. An enlarged stdout pipe lets linphonec
+            # dump debug bursts without stalling on a full 64 KiB buffer.
+            popen_args = [self.config.linphonec_path, "-d", "6"]  # -d 6 = debug level
+            popen_kwargs = {
+                "stdin": subprocess.PIPE,
+                "stdout": subprocess.PIPE,
+                "stderr": subprocess.PIPE,
+                "close_fds": True,
+            }
+            try:
+                self.process = subprocess.Popen(
+                    popen_args, pipesize=262144, **popen_kwargs
+                )
+            except (ValueError, OSError):
+                # pipesize is Linux-only; fall back to the default size
+                self.process = subprocess.Popen(popen_args, **popen_kwargs)
 
             self.running = True
 
@@ -255,9 +284,9 @@ mic_gain_db=10.0
             # Give it a moment to initialize
             time.sleep(2)
 
-            # Check registration status
-            self._send_command("status register")
-
+            # No "status register" query needed: the monitor thread derives
+            # registration state from the Registration/LinphoneRegistration*
+            # lines linphonec prints on its own
             return True
 
         except Exception as e:
@@ -310,9 +339,16 @@ mic_gain_db=10.0
             return False
 
         try:
-            self.process.stdin.write(f"{command}\n")
-            self.process.stdin.flush()
-            logger.debug(f"Sent command: {command}")
+            data = self._command_bytes.get(command)
+            if data is None:
+                data = f"{command}\n".encode("utf-8")
+                self._command_bytes[command] = data
+
+            # Write straight to the pipe fd: one syscall, no wrapper
+            # buffering or separate flush
+            os.write(self.process.stdin.fileno(), data)
+            if debug_enabled():
+                logger.debug(f"Sent command: {command}")
             return True
         except Exception as e:
             logger.error(f"Failed to send command '{command}': {e}")
@@ -322,29 +358,72 @@ mic_gain_db=10.0
         """Monitor linphonec output for events."""
         logger.debug("Output monitor started")
 
-        while self.running and self.process:
-            try:
-                if not self.process.stdout:
-                    break
+        if not self.process or not self.process.stdout:
+            return
 
-                line = self.process.stdout.readline()
-                if not line:
-                    if self.process.poll() is not None:
+        # Read in bulk from the pipe fd instead of readline(): one syscall
+        # can drain a whole burst of linphonec output, and leftover partial
+        # lines stay in the buffer until the next chunk completes them.
+        # A selector supplies the blocking wait, so the thread sleeps until
+        # output arrives and still notices shutdown within the timeout.
+        fd = self.process.stdout.fileno()
+        os.set_blocking(fd, False)
+        selector = selectors.DefaultSelector()
+        selector.register(fd, selectors.EVENT_READ)
+        buffer = b""
+
+        try:
+            while self.running and self.process:
+                try:
+                    if not selector.select(timeout=0.5):
+                        if self.process.poll() is not None:
+                            logger.warning("Linphonec process terminated")
+                            self.running = False
+                            break
+                        continue
+
+                    chunk = os.read(fd, 4096)
+                    if not chunk:
+                        # EOF: the pipe's write end was closed
                         logger.warning("Linphonec process terminated")
                         self.running = False
                         break
-                    continue
 
-                line = line.strip()
-                if line:
-                    self._parse_output(line)
+                    buffer += chunk
+                    lines = buffer.split(b"\n")
+                    buffer = lines.pop()  # Keep any trailing partial line
 
-            except Exception as e:
-                logger.error(f"Error monitoring output: {e}")
-                break
+                    batch = [
+                        line for raw_line in lines
+                        if (line := raw_line.decode("utf-8", errors="replace").strip())
+                    ]
+                    if batch:
+                        self._process_lines(batch)
+
+                except Exception as e:
+                    logger.error(f"Error monitoring output: {e}")
+                    break
+        finally:
+            selector.close()
 
         logger.debug("Output monitor stopped")
 
+    def _process_lines(self, lines: List[str]) -> None:
+        """
+        Parse a batch of coalesced output lines from one read.
+
+        Args:
+            lines: Non-empty, stripped output lines
+        """
+        # One debug record covers the whole batch instead of a log call
+        # per line (log batching); state-change guards downstream keep
+        # duplicate updates within a burst from re-firing callbacks
+        if debug_enabled():
+            logger.debug(f"Linphone ({len(lines)} lines): " + " | ".join(lines))
+
+        for line in lines:
+            self._parse_output(line)
+
     def _parse_output(self, line: str) -> None:
         """
         Parse linphonec output line.
@@ -352,95 +431,95 @@ mic_gain_db=10.0
         Args:
             line: Output line to parse
         """
-        logger.debug(f"Linphone: {line}")
-
-        # Parse registration state
-        if "Registration on" in line and "successful" in line:
-            self._update_registration_state(RegistrationState.OK)
-        elif "Registration on" in line and "failed" in line:
-            self._update_registration_state(RegistrationState.FAILED)
-        elif "Registration on" in line and "cleared" in line:
-            self._update_registration_state(RegistrationState.CLEARED)
-        elif "Refreshing" in line and "registration" in line:
-            logger.debug("Registration refresh in progress")
-        # New pattern for Linphone 5.x
-        elif "LinphoneRegistrationOk" in line or ("Registration successful" in line and "reason" in line):
-            self._update_registration_state(RegistrationState.OK)
-        elif "LinphoneRegistrationProgress" in line:
-            self._update_registration_state(RegistrationState.PROGRESS)
-        elif "LinphoneRegistrationFailed" in line or ("Registration failed" in line and "reason" in line):
-            self._update_registration_state(RegistrationState.FAILED)
-        elif "LinphoneRegistrationCleared" in line:
-            self._update_registration_state(RegistrationState.CLEARED)
-
-        # Parse call state and extract caller info
-        # Look for lines containing call information (case-insensitive)
         line_lower = line.lower()
-        if "call" in line_lower or "callsession" in line_lower:
-            # Try to extract SIP address from line
-            # Linphone format examples:
-            # - Linphone 5.x: "New incoming call from [sip:user@domain]"
-            # - Linphone 4.x: "Receiving new incoming call from <sip:user@domain>"
-            # - Linphone 4.x: "Call from <sip:user@domain>"
-            if "from" in line_lower:
-                # Try Linphone 5.x format with square brackets [sip:...]
-                if "[sip:" in line:
-                    start = line.find("[sip:")
-                    end = line.find("]", start)
-                    if start != -1 and end != -1:
-                        self.caller_address = line[start+1:end]  # Remove [ ]
-                        self.caller_name = self._lookup_contact_name(self.caller_address)
-                        logger.debug(f"Extracted caller address: {self.caller_address}, name: {self.caller_name}")
-                # Try Linphone 4.x format with angle brackets <sip:...>
-                elif "<sip:" in line:
-                    start = line.find("<sip:")
-                    end = line.find(">", start)
-                    if start != -1 and end != -1:
-                        self.caller_address = line[start+1:end]  # Remove < >
-                        self.caller_name = self._lookup_contact_name(self.caller_address)
-                        logger.debug(f"Extracted caller address: {self.caller_address}, name: {self.caller_name}")
-                # Fallback: try to extract plain sip: address
-                elif "sip:" in line.lower():
-                    # Extract from "from sip:user@domain" or similar
-                    parts = line.lower().split("from")
-                    if len(parts) > 1:
-                        # Get everything after "from"
-                        after_from = parts[1].strip()
-                        # Extract sip address
-                        if after_from.startswith("sip:"):
-                            # Find end of SIP address (space, comma, or end of line)
-                            end_chars = [' ', ',', '\t', '\n']
-                            end_pos = len(after_from)
-                            for char in end_chars:
-                                pos = after_from.find(char)
-                                if pos != -1 and pos < end_pos:
-                                    end_pos = pos
-                            self.caller_address = after_from[:end_pos]
-                            self.caller_name = self._lookup_contact_name(self.caller_address)
-                            logger.debug(f"Extracted caller address (fallback): {self.caller_address}, name: {self.caller_name}")
-
-            # Linphone 5.x pattern: "LinphoneCallIncoming"
-            if "LinphoneCallIncoming" in line or "incoming" in line.lower():
-                self._update_call_state(CallState.INCOMING)
-                # Fire incoming call callbacks
-                if self.caller_address:
-                    for callback in self.incoming_call_callbacks:
-                        try:
-                            callback(self.caller_address, self.caller_name or self._extract_username(self.caller_address))
-                        except Exception as e:
-                            logger.error(f"Error in incoming call callback: {e}")
-            elif "outgoing" in line.lower():
-                self._update_call_state(CallState.OUTGOING)
-            elif "connected" in line.lower() or "streams running" in line.lower() or "LinphoneCallConnected" in line:
-                self._update_call_state(CallState.CONNECTED)
-                if not self.call_start_time:
-                    self._start_call_timer()
-            elif "released" in line.lower() or "ended" in line.lower() or "LinphoneCallReleased" in line:
-                self._update_call_state(CallState.RELEASED)
-                self._stop_call_timer()
-                self.current_call_id = None
-                self.caller_address = None
-                self.caller_name = None
+
+        # Route by keyword: most lines (RTP stats, debug noise) contain
+        # neither keyword and fall straight through after two scans instead
+        # of running every registration and call check
+        if "registration" in line_lower:
+            self._parse_registration_line(line_lower)
+
+        if "call" in line_lower:
+            self._parse_call_line(line, line_lower)
+
+    # First match wins; Linphone 4.x prose patterns first, then the 5.x
+    # LinphoneRegistration* state names. All keywords are lowercase since
+    # matching is done on the lowercased line.
+    _REGISTRATION_KEYWORDS = (
+        (("registration on", "successful"), RegistrationState.OK),
+        (("registration on", "failed"), RegistrationState.FAILED),
+        (("registration on", "cleared"), RegistrationState.CLEARED),
+        (("refreshing", "registration"), None),  # Refresh in progress, no state change
+        (("linphoneregistrationok",), RegistrationState.OK),
+        (("registration successful", "reason"), RegistrationState.OK),
+        (("linphoneregistrationprogress",), RegistrationState.PROGRESS),
+        (("linphoneregistrationfailed",), RegistrationState.FAILED),
+        (("registration failed", "reason"), RegistrationState.FAILED),
+        (("linphoneregistrationcleared",), RegistrationState.CLEARED),
+    )
+
+    def _parse_registration_line(self, line_lower: str) -> None:
+        """
+        Parse a registration-related output line.
+
+        Args:
+            line_lower: Lowercased output line
+        """
+        for keywords, state in self._REGISTRATION_KEYWORDS:
+            if all(keyword in line_lower for keyword in keywords):
+                if state is None:
+                    logger.debug("Registration refresh in progress")
+                else:
+                    self._update_registration_state(state)
+                return
+
+    def _parse_call_line(self, line: str, line_lower: str) -> None:
+        """
+        Parse a call-related output line and extract caller info.
+
+        Args:
+            line: Original output line (for address extraction)
+            line_lower: Lowercased output line (for keyword matching)
+        """
+        # Try to extract SIP address from line
+        # Linphone format examples:
+        # - Linphone 5.x: "New incoming call from [sip:user@domain]"
+        # - Linphone 4.x: "Receiving new incoming call from <sip:user@domain>"
+        # - Linphone 4.x: "Call from <sip:user@domain>"
+        if "from" in line_lower:
+            match = _CALLER_ADDRESS_RE.search(line)
+            if match:
+                address = match.group(match.lastgroup)
+                # Ring lines repeat the same address; only re-run the
+                # contact lookup when it actually changes
+                if address != self.caller_address:
+                    self.caller_address = address
+                    self.caller_name = self._lookup_contact_name(address)
+                if debug_enabled():
+                    logger.debug(f"Extracted caller address: {self.caller_address}, name: {self.caller_name}")
+
+        # Linphone 5.x pattern: "LinphoneCallIncoming"
+        if "incoming" in line_lower:
+            self._update_call_state(CallState.INCOMING)
+            # Fire incoming call callbacks
+            if self.caller_address:
+                for callback in tuple(self.incoming_call_callbacks):
+                    try:
+                        callback(self.caller_address, self.caller_name or self._extract_username(self.caller_address))
+                    except Exception as e:
+                        logger.error(f"Error in incoming call callback: {e}")
+        elif "outgoing" in line_lower:
+            self._update_call_state(CallState.OUTGOING)
+        elif "connected" in line_lower or "streams running" in line_lower:
+            self._update_call_state(CallState.CONNECTED)
+            if not self.call_start_time:
+                self._start_call_timer()
+        elif "released" in line_lower or "ended" in line_lower:
+            self._update_call_state(CallState.RELEASED)
+            self._stop_call_timer()
+            self.current_call_id = None
+            self.caller_address = None
+            self.caller_name = None
 
     def _update_registration_state(self, state: RegistrationState) -> None:
         """
@@ -449,14 +528,16 @@ mic_gain_db=10.0
         Args:
             state: New registration state
         """
-        if state != self.registration_state:
+        if state is not self.registration_state:
             old_state = self.registration_state
             self.registration_state = state
-            self.registered = (state == RegistrationState.OK)
+            self.registered = (state is RegistrationState.OK)
 
             logger.info(f"Registration state: {old_state.value} -> {state.value}")
 
-            for callback in self.registration_callbacks:
+            # Snapshot so a callback registering/removing callbacks cannot
+            # mutate the list mid-iteration
+            for callback in tuple(self.registration_callbacks):
                 try:
                     callback(state)
                 except Exception as e:
@@ -469,13 +550,15 @@ mic_gain_db=10.0
         Args:
             state: New call state
         """
-        if state != self.call_state:
+        if state is not self.call_state:
             old_state = self.call_state
             self.call_state = state
 
             logger.info(f"Call state: {old_state.value} -> {state.value}")
 
-            for callback in self.call_state_callbacks:
+            # Snapshot so a callback registering/removing callbacks cannot
+            # mutate the list mid-iteration
+            for callback in tuple(self.call_state_callbacks):
                 try:
                     callback(state)
                 except Exception as e:
@@ -675,7 +758,8 @@ mic_gain_db=10.0
         if self.config_manager:
             contact = self.config_manager.get_contact_by_address(sip_address)
             if contact:
-                logger.debug(f"Found contact: {contact.name} for {sip_address}")
+                if debug_enabled():
+                    logger.debug(f"Found contact: {contact.name} for {sip_address}")
                 return contact.name
 
         # Fall back to extracting username from SIP address
@@ -5,12 +5,14 @@ Manages application states and transitions with validation
 and context tracking.
 """
 
+from collections import defaultdict, deque
 from enum import Enum
-from typing import Optional, Callable, Dict, List, Set
+from typing import Optional, Callable, Dict, List, Set, Tuple
 from dataclasses import dataclass
 from loguru import logger
 
 from yoyopy.app_context import AppContext
+from yoyopy.utils.logger import debug_enabled, info_enabled
 
 
 class AppState(Enum):
@@ -36,7 +38,12 @@ class AppState(Enum):
     CALL_ACTIVE_MUSIC_PAUSED = "call_active_music_paused"  # In call, music paused in background
 
 
-@dataclass
+# Plain dict from state to its label: a single dict-get instead of the
+# Enum .value descriptor lookup in log-formatting paths
+_STATE_NAME: Dict[AppState, str] = {state: state.value for state in AppState}
+
+
+@dataclass(frozen=True, slots=True)
 class StateTransition:
     """Represents a state transition."""
     from_state: AppState
@@ -45,6 +52,27 @@ class StateTransition:
     guard: Optional[Callable[[], bool]] = None  # Optional condition check
 
 
+# Interning pool: identical (from, to, trigger, guard) combinations share
+# one frozen instance, so duplicates cost nothing and identity comparison
+# is safe wherever transitions are cached
+_TRANSITION_INTERN: Dict[Tuple, StateTransition] = {}
+
+
+def _transition(
+    from_state: AppState,
+    to_state: AppState,
+    trigger: str,
+    guard: Optional[Callable[[], bool]] = None,
+) -> StateTransition:
+    """Return the interned StateTransition for the given definition."""
+    key = (from_state, to_state, trigger, guard)
+    transition = _TRANSITION_INTERN.get(key)
+    if transition is None:
+        transition = StateTransition(from_state, to_state, trigger, guard)
+        _TRANSITION_INTERN[key] = transition
+    return transition
+
+
 class StateMachine:
     """
     Manages application state transitions.
@@ -53,6 +81,30 @@ class StateMachine:
     and callback hooks for state changes.
     """
 
+    # State groups for the polling helpers below: frozensets give O(1)
+    # membership tests with no per-call list allocation
+    _CALL_STATES = frozenset({
+        AppState.CALL_INCOMING,
+        AppState.CALL_OUTGOING,
+        AppState.CALL_ACTIVE,
+        AppState.CALL_ACTIVE_MUSIC_PAUSED,
+        AppState.CALLING,  # Legacy
+    })
+    _ACTIVE_CALL_STATES = frozenset({
+        AppState.CALL_INCOMING,
+        AppState.CALL_OUTGOING,
+        AppState.CALL_ACTIVE,
+        AppState.CALL_ACTIVE_MUSIC_PAUSED,
+    })
+    _MUSIC_PLAYING_STATES = frozenset({
+        AppState.PLAYING,
+        AppState.PLAYING_WITH_VOIP,
+    })
+    _PAUSED_BY_CALL_STATES = frozenset({
+        AppState.PAUSED_BY_CALL,
+        AppState.CALL_ACTIVE_MUSIC_PAUSED,
+    })
+
     def __init__(self, context: AppContext) -> None:
         """
         Initialize the state machine.
@@ -63,20 +115,102 @@ class StateMachine:
         self.context = context
         self.current_state = AppState.IDLE
         self.previous_state: Optional[AppState] = None
-        self.state_history: List[AppState] = [AppState.IDLE]
+        # Bounded history: deque drops the oldest entry automatically
+        self.state_history: deque[AppState] = deque([AppState.IDLE], maxlen=50)
 
-        # Callbacks for state changes
-        self.on_enter_callbacks: Dict[AppState, List[Callable]] = {
-            state: [] for state in AppState
-        }
-        self.on_exit_callbacks: Dict[AppState, List[Callable]] = {
-            state: [] for state in AppState
-        }
+        # Callbacks for state changes; most states never get a listener,
+        # so lists are only materialized on first registration
+        self.on_enter_callbacks: Dict[AppState, List[Callable]] = defaultdict(list)
+        self.on_exit_callbacks: Dict[AppState, List[Callable]] = defaultdict(list)
+
+        # States that actually have listeners; most states never get any,
+        # so transition_to can skip dispatch entirely for them
+        self._states_with_enter: Set[AppState] = set()
+        self._states_with_exit: Set[AppState] = set()
 
         # Define valid transitions
         self.transitions: List[StateTransition] = self._define_transitions()
 
-        logger.info(f"StateMachine initialized in {self.current_state.value} state")
+        # One-time integrity check: exact duplicates add nothing at
+        # runtime and usually indicate a spec mistake, so drop them with
+        # a warning before building the dispatch structures
+        seen_transitions: Set[StateTransition] = set()
+        unique_transitions: List[StateTransition] = []
+        for transition in self.transitions:
+            if transition in seen_transitions:
+                logger.warning(
+                    f"Duplicate transition dropped: "
+                    f"{_STATE_NAME[transition.from_state]} -> "
+                    f"{_STATE_NAME[transition.to_state]} "
+                    f"(trigger: {transition.trigger})"
+                )
+                continue
+            seen_transitions.add(transition)
+            unique_transitions.append(transition)
+        self.transitions = unique_transitions
+
+        # Index transitions as nested per-state dispatch rows so lookups
+        # on every keypress are two plain dict-gets (state row, then
+        # trigger column) with no tuple key allocated per check.
+        # self.transitions stays the single source of truth and is only
+        # walked here at build time; all runtime lookups go through the
+        # derived maps below.
+        # Guard-less transitions (currently all of them) are partitioned
+        # into frozen target-state sets at build time, so the common path
+        # is a set membership test with no per-check guard branch.
+        unguarded: Dict[AppState, Dict[str, Set[AppState]]] = {state: {} for state in AppState}
+        guarded: Dict[AppState, Dict[str, List[StateTransition]]] = {state: {} for state in AppState}
+        self._guarded_by_from: Dict[AppState, List[StateTransition]] = {}
+        for transition in self.transitions:
+            if transition.guard is None:
+                unguarded[transition.from_state].setdefault(transition.trigger, set()).add(
+                    transition.to_state
+                )
+            else:
+                guarded[transition.from_state].setdefault(transition.trigger, []).append(
+                    transition
+                )
+                self._guarded_by_from.setdefault(transition.from_state, []).append(transition)
+
+        # Freeze the rows: inner values become frozenset/tuple so the
+        # runtime structures are immutable after construction
+        self._unguarded_rows: Dict[AppState, Dict[str, frozenset]] = {
+            state: {trig: frozenset(targets) for trig, targets in row.items()}
+            for state, row in unguarded.items()
+        }
+        self._guarded_rows: Dict[AppState, Dict[str, Tuple[StateTransition, ...]]] = {
+            state: {trig: tuple(candidates) for trig, candidates in row.items()}
+            for state, row in guarded.items()
+        }
+
+        # Per-state maps resolved once at build time so
+        # get_valid_transitions/get_valid_triggers never rescan the table.
+        # Guarded transitions are excluded here and evaluated at call time.
+        self._next_states: Dict[AppState, List[AppState]] = {state: [] for state in AppState}
+        self._triggers_from: Dict[AppState, List[str]] = {state: [] for state in AppState}
+        for transition in self.transitions:
+            if (transition.guard is None and
+                    transition.to_state not in self._next_states[transition.from_state]):
+                self._next_states[transition.from_state].append(transition.to_state)
+            if transition.trigger not in self._triggers_from[transition.from_state]:
+                self._triggers_from[transition.from_state].append(transition.trigger)
+
+        # Frozen per-state results for get_valid_transitions, filled on
+        # first use; only valid for states without guarded transitions
+        self._valid_transitions_cache: Dict[AppState, Tuple[AppState, ...]] = {}
+
+        # Fallback map for the back button: each state declares at most
+        # one guard-less "back" target, so go_back resolves with a
+        # single dict-get instead of consulting the history
+        self._back_targets: Dict[AppState, AppState] = {}
+        for transition in self.transitions:
+            if transition.trigger == "back" and transition.guard is None:
+                self._back_targets.setdefault(transition.from_state, transition.to_state)
+
+        logger.info(
+            f"StateMachine initialized in {_STATE_NAME[self.current_state]} state "
+            f"({len(self.transitions)} transitions)"
+        )
 
     def _define_transitions(self) -> List[StateTransition]:
         """
@@ -87,108 +221,108 @@ class StateMachine:
         """
         return [
             # From IDLE
-            StateTransition(AppState.IDLE, AppState.MENU, "open_menu"),
-            StateTransition(AppState.IDLE, AppState.SETTINGS, "open_settings"),
-            StateTransition(AppState.IDLE, AppState.CONNECTING, "connect"),
-            StateTransition(AppState.IDLE, AppState.CALL_INCOMING, "incoming_call"),  # Allow calls while idle
+            _transition(AppState.IDLE, AppState.MENU, "open_menu"),
+            _transition(AppState.IDLE, AppState.SETTINGS, "open_settings"),
+            _transition(AppState.IDLE, AppState.CONNECTING, "connect"),
+            _transition(AppState.IDLE, AppState.CALL_INCOMING, "incoming_call"),  # Allow calls while idle
 
             # From MENU
-            StateTransition(AppState.MENU, AppState.IDLE, "back"),
-            StateTransition(AppState.MENU, AppState.PLAYING, "select_media"),
-            StateTransition(AppState.MENU, AppState.PLAYLIST, "select_playlist"),
-            StateTransition(AppState.MENU, AppState.PLAYLIST_BROWSER, "browse_playlists"),
-            StateTransition(AppState.MENU, AppState.CALL_IDLE, "open_voip"),
-            StateTransition(AppState.MENU, AppState.SETTINGS, "select_settings"),
+            _transition(AppState.MENU, AppState.IDLE, "back"),
+            _transition(AppState.MENU, AppState.PLAYING, "select_media"),
+            _transition(AppState.MENU, AppState.PLAYLIST, "select_playlist"),
+            _transition(AppState.MENU, AppState.PLAYLIST_BROWSER, "browse_playlists"),
+            _transition(AppState.MENU, AppState.CALL_IDLE, "open_voip"),
+            _transition(AppState.MENU, AppState.SETTINGS, "select_settings"),
 
             # From PLAYING
-            StateTransition(AppState.PLAYING, AppState.PAUSED, "pause"),
-            StateTransition(AppState.PLAYING, AppState.MENU, "back"),
-            StateTransition(AppState.PLAYING, AppState.IDLE, "stop"),
+            _transition(AppState.PLAYING, AppState.PAUSED, "pause"),
+            _transition(AppState.PLAYING, AppState.MENU, "back"),
+            _transition(AppState.PLAYING, AppState.IDLE, "stop"),
 
             # From PAUSED
-            StateTransition(AppState.PAUSED, AppState.PLAYING, "resume"),
-            StateTransition(AppState.PAUSED, AppState.PLAYING_WITH_VOIP, "resume"),  # Resume with VoIP
-            StateTransition(AppState.PAUSED, AppState.MENU, "back"),
-            StateTransition(AppState.PAUSED, AppState.IDLE, "stop"),
+            _transition(AppState.PAUSED, AppState.PLAYING, "resume"),
+            _transition(AppState.PAUSED, AppState.PLAYING_WITH_VOIP, "resume"),  # Resume with VoIP
+            _transition(AppState.PAUSED, AppState.MENU, "back"),
+            _transition(AppState.PAUSED, AppState.IDLE, "stop"),
 
             # From PLAYLIST
-            StateTransition(AppState.PLAYLIST, AppState.MENU, "back"),
-            StateTransition(AppState.PLAYLIST, AppState.PLAYING, "select_track"),
+            _transition(AppState.PLAYLIST, AppState.MENU, "back"),
+            _transition(AppState.PLAYLIST, AppState.PLAYING, "select_track"),
 
             # From PLAYLIST_BROWSER
-            StateTransition(AppState.PLAYLIST_BROWSER, AppState.MENU, "back"),
-            StateTransition(AppState.PLAYLIST_BROWSER, AppState.PLAYING, "load_playlist"),
+            _transition(AppState.PLAYLIST_BROWSER, AppState.MENU, "back"),
+            _transition(AppState.PLAYLIST_BROWSER, AppState.PLAYING, "load_playlist"),
 
             # From CALL_IDLE
-            StateTransition(AppState.CALL_IDLE, AppState.MENU, "back"),
-            StateTransition(AppState.CALL_IDLE, AppState.CALL_OUTGOING, "make_call"),
-            StateTransition(AppState.CALL_IDLE, AppState.CALL_INCOMING, "incoming_call"),
-            StateTransition(AppState.CALL_IDLE, AppState.CALLING, "make_call"),  # Legacy
-            StateTransition(AppState.CALL_IDLE, AppState.CALLING, "incoming_call"),  # Legacy
+            _transition(AppState.CALL_IDLE, AppState.MENU, "back"),
+            _transition(AppState.CALL_IDLE, AppState.CALL_OUTGOING, "make_call"),
+            _transition(AppState.CALL_IDLE, AppState.CALL_INCOMING, "incoming_call"),
+            _transition(AppState.CALL_IDLE, AppState.CALLING, "make_call"),  # Legacy
+            _transition(AppState.CALL_IDLE, AppState.CALLING, "incoming_call"),  # Legacy
 
             # From CALL_INCOMING
-            StateTransition(AppState.CALL_INCOMING, AppState.CALL_ACTIVE, "answer_call"),
-            StateTransition(AppState.CALL_INCOMING, AppState.CALL_ACTIVE, "call_connected"),  # VoIP manager uses this trigger
-            StateTransition(AppState.CALL_INCOMING, AppState.CALL_IDLE, "reject_call"),
-            StateTransition(AppState.CALL_INCOMING, AppState.CALL_IDLE, "call_ended"),
+            _transition(AppState.CALL_INCOMING, AppState.CALL_ACTIVE, "answer_call"),
+            _transition(AppState.CALL_INCOMING, AppState.CALL_ACTIVE, "call_connected"),  # VoIP manager uses this trigger
+            _transition(AppState.CALL_INCOMING, AppState.CALL_IDLE, "reject_call"),
+            _transition(AppState.CALL_INCOMING, AppState.CALL_IDLE, "call_ended"),
 
             # From CALL_OUTGOING
-            StateTransition(AppState.CALL_OUTGOING, AppState.CALL_ACTIVE, "call_connected"),
-            StateTransition(AppState.CALL_OUTGOING, AppState.CALL_IDLE, "cancel_call"),
-            StateTransition(AppState.CALL_OUTGOING, AppState.CALL_IDLE, "call_failed"),
+            _transition(AppState.CALL_OUTGOING, AppState.CALL_ACTIVE, "call_connected"),
+            _transition(AppState.CALL_OUTGOING, AppState.CALL_IDLE, "cancel_call"),
+            _transition(AppState.CALL_OUTGOING, AppState.CALL_IDLE, "call_failed"),
 
             # From CALL_ACTIVE
-            StateTransition(AppState.CALL_ACTIVE, AppState.CALL_IDLE, "end_call"),
-            StateTransition(AppState.CALL_ACTIVE, AppState.CALL_IDLE, "call_ended"),
+            _transition(AppState.CALL_ACTIVE, AppState.CALL_IDLE, "end_call"),
+            _transition(AppState.CALL_ACTIVE, AppState.CALL_IDLE, "call_ended"),
 
             # From CALLING (Legacy - keep for backward compatibility)
-            StateTransition(AppState.CALLING, AppState.CALL_IDLE, "call_ended"),
-            StateTransition(AppState.CALLING, AppState.MENU, "back"),
+            _transition(AppState.CALLING, AppState.CALL_IDLE, "call_ended"),
+            _transition(AppState.CALLING, AppState.MENU, "back"),
 
             # From SETTINGS
-            StateTransition(AppState.SETTINGS, AppState.MENU, "back"),
-            StateTransition(AppState.SETTINGS, AppState.IDLE, "home"),
+            _transition(AppState.SETTINGS, AppState.MENU, "back"),
+            _transition(AppState.SETTINGS, AppState.IDLE, "home"),
 
             # From CONNECTING
-            StateTransition(AppState.CONNECTING, AppState.IDLE, "cancel"),
-            StateTransition(AppState.CONNECTING, AppState.MENU, "connected"),
+            _transition(AppState.CONNECTING, AppState.IDLE, "cancel"),
+            _transition(AppState.CONNECTING, AppState.MENU, "connected"),
 
             # From ERROR - can go to idle
-            StateTransition(AppState.ERROR, AppState.IDLE, "reset"),
+            _transition(AppState.ERROR, AppState.IDLE, "reset"),
 
             # VoIP + Music Integration Transitions
             # Music to VoIP-ready music
-            StateTransition(AppState.PLAYING, AppState.PLAYING_WITH_VOIP, "voip_ready"),
-            StateTransition(AppState.PLAYLIST_BROWSER, AppState.PLAYING_WITH_VOIP, "load_playlist_with_voip"),
-            StateTransition(AppState.MENU, AppState.PLAYING_WITH_VOIP, "select_media_with_voip"),
+            _transition(AppState.PLAYING, AppState.PLAYING_WITH_VOIP, "voip_ready"),
+            _transition(AppState.PLAYLIST_BROWSER, AppState.PLAYING_WITH_VOIP, "load_playlist_with_voip"),
+            _transition(AppState.MENU, AppState.PLAYING_WITH_VOIP, "select_media_with_voip"),
 
             # From PLAYING_WITH_VOIP (music playing, VoIP ready)
-            StateTransition(AppState.PLAYING_WITH_VOIP, AppState.PAUSED, "pause"),
-            StateTransition(AppState.PLAYING_WITH_VOIP, AppState.MENU, "back"),
-            StateTransition(AppState.PLAYING_WITH_VOIP, AppState.IDLE, "stop"),
-            StateTransition(AppState.PLAYING_WITH_VOIP, AppState.PAUSED_BY_CALL, "auto_pause_for_call"),
-            StateTransition(AppState.PLAYING_WITH_VOIP, AppState.CALL_INCOMING, "incoming_call"),
+            _transition(AppState.PLAYING_WITH_VOIP, AppState.PAUSED, "pause"),
+            _transition(AppState.PLAYING_WITH_VOIP, AppState.MENU, "back"),
+            _transition(AppState.PLAYING_WITH_VOIP, AppState.IDLE, "stop"),
+            _transition(AppState.PLAYING_WITH_VOIP, AppState.PAUSED_BY_CALL, "auto_pause_for_call"),
+            _transition(AppState.PLAYING_WITH_VOIP, AppState.CALL_INCOMING, "incoming_call"),
 
             # From PAUSED_BY_CALL (music paused for call)
-            StateTransition(AppState.PAUSED_BY_CALL, AppState.CALL_INCOMING, "incoming_call_ringing"),
-            StateTransition(AppState.PAUSED_BY_CALL, AppState.CALL_ACTIVE_MUSIC_PAUSED, "call_answered"),
-            StateTransition(AppState.PAUSED_BY_CALL, AppState.PLAYING_WITH_VOIP, "call_rejected_resume"),
-            StateTransition(AppState.PAUSED_BY_CALL, AppState.PAUSED, "call_rejected_stay_paused"),
+            _transition(AppState.PAUSED_BY_CALL, AppState.CALL_INCOMING, "incoming_call_ringing"),
+            _transition(AppState.PAUSED_BY_CALL, AppState.CALL_ACTIVE_MUSIC_PAUSED, "call_answered"),
+            _transition(AppState.PAUSED_BY_CALL, AppState.PLAYING_WITH_VOIP, "call_rejected_resume"),
+            _transition(AppState.PAUSED_BY_CALL, AppState.PAUSED, "call_rejected_stay_paused"),
 
             # From CALL_INCOMING with music in background
-            StateTransition(AppState.CALL_INCOMING, AppState.CALL_ACTIVE_MUSIC_PAUSED, "answer_call_resume_after"),
-            StateTransition(AppState.CALL_INCOMING, AppState.PAUSED, "reject_call_stay_paused"),
-            StateTransition(AppState.CALL_INCOMING, AppState.PLAYING_WITH_VOIP, "reject_call_resume"),
-            StateTransition(AppState.CALL_INCOMING, AppState.PLAYING_WITH_VOIP, "call_ended_auto_resume"),  # Call ends before answer
+            _transition(AppState.CALL_INCOMING, AppState.CALL_ACTIVE_MUSIC_PAUSED, "answer_call_resume_after"),
+            _transition(AppState.CALL_INCOMING, AppState.PAUSED, "reject_call_stay_paused"),
+            _transition(AppState.CALL_INCOMING, AppState.PLAYING_WITH_VOIP, "reject_call_resume"),
+            _transition(AppState.CALL_INCOMING, AppState.PLAYING_WITH_VOIP, "call_ended_auto_resume"),  # Call ends before answer
 
             # From CALL_ACTIVE_MUSIC_PAUSED (in call, music paused)
-            StateTransition(AppState.CALL_ACTIVE_MUSIC_PAUSED, AppState.PLAYING_WITH_VOIP, "call_ended_auto_resume"),
-            StateTransition(AppState.CALL_ACTIVE_MUSIC_PAUSED, AppState.PAUSED, "call_ended_stay_paused"),
-            StateTransition(AppState.CALL_ACTIVE_MUSIC_PAUSED, AppState.MENU, "call_ended_stop_music"),
+            _transition(AppState.CALL_ACTIVE_MUSIC_PAUSED, AppState.PLAYING_WITH_VOIP, "call_ended_auto_resume"),
+            _transition(AppState.CALL_ACTIVE_MUSIC_PAUSED, AppState.PAUSED, "call_ended_stay_paused"),
+            _transition(AppState.CALL_ACTIVE_MUSIC_PAUSED, AppState.MENU, "call_ended_stop_music"),
 
             # Outgoing call from music screen
-            StateTransition(AppState.PLAYING_WITH_VOIP, AppState.CALL_OUTGOING, "make_call_pause_music"),
-            StateTransition(AppState.CALL_OUTGOING, AppState.CALL_ACTIVE_MUSIC_PAUSED, "call_connected_music_paused"),
+            _transition(AppState.PLAYING_WITH_VOIP, AppState.CALL_OUTGOING, "make_call_pause_music"),
+            _transition(AppState.CALL_OUTGOING, AppState.CALL_ACTIVE_MUSIC_PAUSED, "call_connected_music_paused"),
         ]
 
     def can_transition(self, to_state: AppState, trigger: str = "manual") -> bool:
@@ -202,28 +336,28 @@ class StateMachine:
         Returns:
             True if transition is valid, False otherwise
         """
-        # Find matching transition
-        for transition in self.transitions:
-            if (transition.from_state == self.current_state and
-                transition.to_state == to_state and
-                transition.trigger == trigger):
-
-                # Check guard condition if present
-                if transition.guard and not transition.guard():
-                    logger.warning(
-                        f"Transition {self.current_state.value} -> {to_state.value} "
-                        f"blocked by guard"
-                    )
-                    return False
+        # Fast path: guard-less transitions resolve with two dict-gets
+        # and one set lookup
+        if to_state in self._unguarded_rows[self.current_state].get(trigger, ()):
+            return True
 
-                return True
+        # Guarded transitions evaluate their condition
+        for transition in self._guarded_rows[self.current_state].get(trigger, ()):
+            if transition.to_state is to_state:
+                if transition.guard():
+                    return True
+                logger.warning(
+                    f"Transition {_STATE_NAME[self.current_state]} -> {_STATE_NAME[to_state]} "
+                    f"blocked by guard"
+                )
+                return False
 
         # Check if it's the same state (always allowed)
-        if to_state == self.current_state:
+        if to_state is self.current_state:
             return True
 
         logger.warning(
-            f"Invalid transition: {self.current_state.value} -> {to_state.value} "
+            f"Invalid transition: {_STATE_NAME[self.current_state]} -> {_STATE_NAME[to_state]} "
             f"(trigger: {trigger})"
         )
         return False
@@ -242,36 +376,82 @@ class StateMachine:
         # Check if transition is valid
         if not self.can_transition(new_state, trigger):
             logger.error(
-                f"Cannot transition from {self.current_state.value} "
-                f"to {new_state.value}"
+                f"Cannot transition from {_STATE_NAME[self.current_state]} "
+                f"to {_STATE_NAME[new_state]}"
             )
             return False
 
         # Don't do anything if already in target state
-        if new_state == self.current_state:
-            logger.debug(f"Already in {new_state.value} state")
+        if new_state is self.current_state:
+            if debug_enabled():
+                logger.debug(f"Already in {_STATE_NAME[new_state]} state")
             return True
 
+        self._do_transition(new_state, trigger)
+        return True
+
+    def _do_transition(self, new_state: AppState, trigger: str) -> None:
+        """
+        Perform a transition already known to be valid.
+
+        State update and callback dispatch without validation; callers
+        must have checked the transition first.
+
+        Args:
+            new_state: Target state (distinct from the current state)
+            trigger: Trigger name
+        """
         old_state = self.current_state
 
+        # Resolve both callback lists up front: exit callbacks may register
+        # further callbacks, and the dict lookups happen once per transition
+        has_exit = old_state in self._states_with_exit
+        has_enter = new_state in self._states_with_enter
+        exit_callbacks = self.on_exit_callbacks[old_state] if has_exit else ()
+        enter_callbacks = self.on_enter_callbacks[new_state] if has_enter else ()
+
+        # Loguru formats eagerly, so skip building the per-transition
+        # strings when no sink records INFO
+        log_info = info_enabled()
+
         # Exit current state
-        logger.info(f"Exiting state: {old_state.value}")
-        self._fire_callbacks(self.on_exit_callbacks[old_state])
+        if log_info:
+            logger.info(f"Exiting state: {_STATE_NAME[old_state]}")
+        if has_exit:
+            self._fire_callbacks(exit_callbacks)
 
         # Update state
         self.previous_state = old_state
         self.current_state = new_state
         self.state_history.append(new_state)
 
-        # Limit history size
-        if len(self.state_history) > 50:
-            self.state_history = self.state_history[-50:]
-
         # Enter new state
-        logger.info(f"Entering state: {new_state.value} (trigger: {trigger})")
-        self._fire_callbacks(self.on_enter_callbacks[new_state])
+        if log_info:
+            logger.info(f"Entering state: {_STATE_NAME[new_state]} (trigger: {trigger})")
+        if has_enter:
+            self._fire_callbacks(enter_callbacks)
 
-        return True
+    def _fast_transition(self, new_state: AppState, trigger: str) -> bool:
+        """
+        Transition for trusted call sites with known trigger/state pairs.
+
+        The convenience wrappers below always pass a trigger that is
+        legal for the intended target, so the common case resolves with
+        one dispatch-row lookup and goes straight to _do_transition.
+        Anything else (guards, same-state, invalid pairs) falls back to
+        the validating public entry point.
+
+        Args:
+            new_state: Target state
+            trigger: Trigger name
+
+        Returns:
+            True if transition succeeded, False otherwise
+        """
+        if new_state in self._unguarded_rows[self.current_state].get(trigger, ()):
+            self._do_transition(new_state, trigger)
+            return True
+        return self.transition_to(new_state, trigger)
 
     def go_back(self) -> bool:
         """
@@ -280,6 +460,13 @@ class StateMachine:
         Returns:
             True if successful, False otherwise
         """
+        # Fast path: the transition table declares where "back" leads
+        # from this state, so resolve it with one dict-get
+        target = self._back_targets.get(self.current_state)
+        if target is not None:
+            self._do_transition(target, "back")
+            return True
+
         if len(self.state_history) < 2:
             logger.warning("Cannot go back: no previous state")
             return False
@@ -288,10 +475,7 @@ class StateMachine:
         # state_history[-1] is current, [-2] is previous
         previous = self.state_history[-2]
 
-        # Determine trigger based on current state
-        trigger = "back"
-
-        return self.transition_to(previous, trigger)
+        return self.transition_to(previous, "back")
 
     def on_enter(self, state: AppState, callback: Callable) -> None:
         """
@@ -301,8 +485,10 @@ class StateMachine:
             state: State to register callback for
             callback: Function to call when entering state
         """
-        self.on_enter_callbacks[state].append(callback)
-        logger.debug(f"Registered on_enter callback for {state.value}")
+        self.on_enter_callbacks[state].append(self._safe_callback(callback))
+        self._states_with_enter.add(state)
+        if debug_enabled():
+            logger.debug(f"Registered on_enter callback for {_STATE_NAME[state]}")
 
     def on_exit(self, state: AppState, callback: Callable) -> None:
         """
@@ -312,75 +498,120 @@ class StateMachine:
             state: State to register callback for
             callback: Function to call when exiting state
         """
-        self.on_exit_callbacks[state].append(callback)
-        logger.debug(f"Registered on_exit callback for {state.value}")
+        self.on_exit_callbacks[state].append(self._safe_callback(callback))
+        self._states_with_exit.add(state)
+        if debug_enabled():
+            logger.debug(f"Registered on_exit callback for {_STATE_NAME[state]}")
 
-    def _fire_callbacks(self, callbacks: List[Callable]) -> None:
+    @staticmethod
+    def _safe_callback(callback: Callable) -> Callable:
         """
-        Fire all callbacks in a list.
+        Wrap a callback so exceptions are logged instead of propagating.
+
+        Installed once at registration time, which keeps the dispatch loop
+        free of per-call try/except frames.
 
         Args:
-            callbacks: List of callbacks to fire
+            callback: Callback to wrap
+
+        Returns:
+            Exception-safe wrapper
         """
-        for callback in callbacks:
+        def wrapper() -> None:
             try:
                 callback()
             except Exception as e:
                 logger.error(f"Error in state callback: {e}")
+        return wrapper
+
+    def _fire_callbacks(self, callbacks: List[Callable]) -> None:
+        """
+        Fire all callbacks in a list.
 
-    def get_valid_transitions(self) -> List[AppState]:
+        Callbacks are already exception-safe (wrapped at registration),
+        so dispatch is a plain call loop.
+
+        Args:
+            callbacks: List of callbacks to fire
+        """
+        # Snapshot so a callback registering another callback for the same
+        # state cannot mutate the list mid-iteration
+        for callback in tuple(callbacks):
+            callback()
+
+    def get_valid_transitions(self) -> Tuple[AppState, ...]:
         """
-        Get list of valid states that can be transitioned to from current state.
+        Get the states that can be transitioned to from the current state.
 
         Returns:
-            List of valid target states
+            Tuple of valid target states
         """
-        valid_states = []
-        for transition in self.transitions:
-            if transition.from_state == self.current_state:
-                # Check guard if present
-                if not transition.guard or transition.guard():
-                    if transition.to_state not in valid_states:
-                        valid_states.append(transition.to_state)
-        return valid_states
+        state = self.current_state
+        guarded = self._guarded_by_from.get(state)
+
+        if guarded is None:
+            # Guard-less states dominate, and their answer never changes:
+            # build the frozen tuple once and hand it out on every call
+            cached = self._valid_transitions_cache.get(state)
+            if cached is None:
+                cached = tuple(self._next_states[state])
+                self._valid_transitions_cache[state] = cached
+            return cached
+
+        # Guard results can change between calls, so evaluate them fresh
+        valid_states = list(self._next_states[state])
+        for transition in guarded:
+            if transition.guard() and transition.to_state not in valid_states:
+                valid_states.append(transition.to_state)
+        return tuple(valid_states)
+
+    def get_valid_triggers(self) -> List[str]:
+        """
+        Get list of trigger names available from the current state.
+
+        Returns:
+            List of trigger names
+        """
+        return list(self._triggers_from[self.current_state])
 
     def reset(self) -> None:
         """Reset state machine to initial state."""
         logger.info("Resetting state machine")
         self.transition_to(AppState.IDLE, "reset")
-        self.state_history = [AppState.IDLE]
+        self.state_history.clear()
+        self.state_history.append(AppState.IDLE)
         self.previous_state = None
 
     # Convenience methods for common transitions
 
     def open_menu(self) -> bool:
         """Transition to MENU state."""
-        return self.transition_to(AppState.MENU, "open_menu")
+        return self._fast_transition(AppState.MENU, "open_menu")
 
     def start_playback(self) -> bool:
         """Transition to PLAYING state."""
-        if self.transition_to(AppState.PLAYING, "select_media"):
+        if self._fast_transition(AppState.PLAYING, "select_media"):
             self.context.play()
             return True
         return False
 
     def pause_playback(self) -> bool:
         """Transition to PAUSED state."""
-        if self.transition_to(AppState.PAUSED, "pause"):
+        if self._fast_transition(AppState.PAUSED, "pause"):
             self.context.pause()
             return True
         return False
 
     def resume_playback(self) -> bool:
         """Transition to PLAYING state from PAUSED."""
-        if self.transition_to(AppState.PLAYING, "resume"):
+        if self._fast_transition(AppState.PLAYING, "resume"):
             self.context.resume()
             return True
         return False
 
     def stop_playback(self) -> bool:
         """Stop playback and return to IDLE."""
-        if self.transition_to(AppState.IDLE, "stop"):
+        if self._fast_transition(AppState.IDLE, "stop"):
             self.context.stop()
             return True
         return False
@@ -392,10 +623,10 @@ class StateMachine:
         Returns:
             True if now playing, False if paused
         """
-        if self.current_state == AppState.PLAYING:
+        if self.current_state is AppState.PLAYING:
             self.pause_playback()
             return False
-        elif self.current_state == AppState.PAUSED:
+        elif self.current_state is AppState.PAUSED:
             self.resume_playback()
             return True
         else:
@@ -405,62 +636,42 @@ class StateMachine:
 
     def open_settings(self) -> bool:
         """Transition to SETTINGS state."""
-        return self.transition_to(AppState.SETTINGS, "select_settings")
+        return self._fast_transition(AppState.SETTINGS, "select_settings")
 
     def get_state_name(self) -> str:
         """Get the current state name."""
-        return self.current_state.value
+        return _STATE_NAME[self.current_state]
 
     def is_playing(self) -> bool:
         """Check if currently in PLAYING state."""
-        return self.current_state == AppState.PLAYING
+        return self.current_state is AppState.PLAYING
 
     def is_idle(self) -> bool:
         """Check if currently in IDLE state."""
-        return self.current_state == AppState.IDLE
+        return self.current_state is AppState.IDLE
 
     # VoIP + Music Integration helper methods
 
     def is_playing_with_voip(self) -> bool:
         """Check if currently playing music with VoIP ready."""
-        return self.current_state == AppState.PLAYING_WITH_VOIP
+        return self.current_state is AppState.PLAYING_WITH_VOIP
 
     def is_music_paused_by_call(self) -> bool:
         """Check if music is paused due to call."""
-        return self.current_state in [
-            AppState.PAUSED_BY_CALL,
-            AppState.CALL_ACTIVE_MUSIC_PAUSED
-        ]
+        return self.current_state in self._PAUSED_BY_CALL_STATES
 
     def is_in_call(self) -> bool:
         """Check if currently in any call state."""
-        return self.current_state in [
-            AppState.CALL_INCOMING,
-            AppState.CALL_OUTGOING,
-            AppState.CALL_ACTIVE,
-            AppState.CALL_ACTIVE_MUSIC_PAUSED,
-            AppState.CALLING  # Legacy
-        ]
+        return self.current_state in self._CALL_STATES
 
     def is_music_playing(self) -> bool:
         """Check if music is currently playing (any music state)."""
-        return self.current_state in [
-            AppState.PLAYING,
-            AppState.PLAYING_WITH_VOIP
-        ]
+        return self.current_state in self._MUSIC_PLAYING_STATES
 
     def has_paused_music_for_call(self) -> bool:
         """Check if we have music paused that should resume after call."""
-        return self.current_state in [
-            AppState.PAUSED_BY_CALL,
-            AppState.CALL_ACTIVE_MUSIC_PAUSED
-        ]
+        return self.current_state in self._PAUSED_BY_CALL_STATES
 
     def is_call_active(self) -> bool:
         """Check if there is currently an active call (any call state)."""
-        return self.current_state in [
-            AppState.CALL_INCOMING,
-            AppState.CALL_OUTGOING,
-            AppState.CALL_ACTIVE,
-            AppState.CALL_ACTIVE_MUSIC_PAUSED
-        ]
+        return self.current_state in self._ACTIVE_CALL_STATES
@@ -11,11 +11,17 @@ The Display class provides a unified interface that works with any supported har
 
 from yoyopy.ui.display.display_hal import DisplayHAL
 from yoyopy.ui.display.display_manager import Display
-from yoyopy.ui.display.display_factory import get_display, detect_hardware, get_hardware_info
+from yoyopy.ui.display.display_factory import (
+    HardwareInfo,
+    get_display,
+    detect_hardware,
+    get_hardware_info,
+)
 
 __all__ = [
     'DisplayHAL',
     'Display',
+    'HardwareInfo',
     'get_display',
     'detect_hardware',
     'get_hardware_info',
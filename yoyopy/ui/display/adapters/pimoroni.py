@@ -15,12 +15,14 @@ Author: YoyoPod Team
 Date: 2025-11-30
 """
 
-from yoyopy.ui.display.display_hal import DisplayHAL
+from yoyopy.ui.display.display_hal import DisplayHAL, PillowDrawMixin
 from typing import Optional, Tuple
-from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont
+import threading
+from PIL import Image, ImageDraw
 from loguru import logger
 
+from yoyopy.utils.logger import debug_enabled
+
 try:
     from displayhatmini import DisplayHATMini
     HAS_HARDWARE = True
@@ -29,7 +31,7 @@ except ImportError:
     logger.warning("DisplayHATMini library not available - adapter will run in simulation mode")
 
 
-class PimoroniDisplayAdapter(DisplayHAL):
+class PimoroniDisplayAdapter(PillowDrawMixin, DisplayHAL):
     """
     Hardware adapter for Pimoroni Display HAT Mini.
 
@@ -47,6 +49,17 @@ class PimoroniDisplayAdapter(DisplayHAL):
     ORIENTATION = "landscape"
     STATUS_BAR_HEIGHT = 20
 
+    # Status-bar geometry: fixed for the 320x240 layout, so resolved
+    # once at class scope instead of re-derived on every refresh
+    _BATTERY_X = WIDTH - 50
+    _BATTERY_Y = 4
+    _BATTERY_WIDTH = 40
+    _BATTERY_HEIGHT = 12
+    _SIGNAL_BAR_BBOXES = tuple(
+        (5 + i * 5, 16 - i * 2, 5 + i * 5 + 3, 20)
+        for i in range(4)
+    )
+
     def __init__(self, simulate: bool = False) -> None:
         """
         Initialize the Pimoroni Display HAT Mini.
@@ -59,15 +72,49 @@ class PimoroniDisplayAdapter(DisplayHAL):
         self.draw: Optional[ImageDraw.ImageDraw] = None
         self.device = None
 
+        # Shadow of the last frame pushed over SPI, used to skip the
+        # transfer entirely when nothing changed
+        self._last_frame: Optional[bytes] = None
+
+        # Double-buffered flush: the UI draws into self.buffer while a
+        # worker thread pushes the front buffer over SPI, so the main
+        # loop never blocks on the transfer
+        self._front_buffer: Optional[Image.Image] = None
+        self._flush_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._flush_stop = False
+        self._flush_thread: Optional[threading.Thread] = None
+
         # Create PIL drawing buffer
         self._create_buffer()
 
+        # Pre-compose the immutable parts of the status bar (background,
+        # battery outline and tip, empty signal bars) so each refresh is
+        # one paste plus the variable pieces
+        self._status_bg = self._build_status_background()
+
+        # Clock strings are always HH:MM in the 14 px status font, so
+        # measure "00:00" once and center against that instead of the
+        # old len(time_str) * 8 estimate per refresh
+        time_width = int(self._get_font(None, 14).getlength("00:00"))
+        self._time_x = (self.WIDTH - time_width) // 2
+
         if not self.simulate:
             try:
-                # Initialize DisplayHATMini with buffer and backlight PWM
-                self.device = DisplayHATMini(self.buffer, backlight_pwm=True)
+                # The driver binds to one PIL image for its lifetime, so
+                # register a dedicated front buffer and keep self.buffer
+                # as the back buffer the UI draws into
+                self._front_buffer = self.buffer.copy()
+                self.device = DisplayHATMini(self._front_buffer, backlight_pwm=True)
                 self.device.set_backlight(1.0)  # Full brightness
                 self.device.set_led(0.1, 0.0, 0.5)  # Purple LED indicator
+
+                self._flush_thread = threading.Thread(
+                    target=self._flush_worker,
+                    daemon=True,
+                    name="pimoroni-flush"
+                )
+                self._flush_thread.start()
                 logger.info("Pimoroni Display HAT Mini initialized (320×240 landscape)")
             except Exception as e:
                 logger.error(f"Failed to initialize Pimoroni display hardware: {e}")
@@ -77,109 +124,38 @@ class PimoroniDisplayAdapter(DisplayHAL):
         else:
             logger.info("Pimoroni display adapter running in simulation mode")
 
-    def _create_buffer(self) -> None:
-        """Create a new PIL drawing buffer."""
-        self.buffer = Image.new('RGB', (self.WIDTH, self.HEIGHT), self.COLOR_BLACK)
-        self.draw = ImageDraw.Draw(self.buffer)
-
-    def clear(self, color: Optional[Tuple[int, int, int]] = None) -> None:
-        """Clear the display with specified color."""
-        if color is None:
-            color = self.COLOR_BLACK
-
-        self.draw.rectangle([(0, 0), (self.WIDTH, self.HEIGHT)], fill=color)
-        logger.debug(f"Pimoroni display cleared with color {color}")
-
-    def text(
-        self,
-        text: str,
-        x: int,
-        y: int,
-        color: Optional[Tuple[int, int, int]] = None,
-        font_size: int = 16,
-        font_path: Optional[Path] = None
-    ) -> None:
-        """Draw text at specified position."""
-        if color is None:
-            color = self.COLOR_WHITE
-
-        try:
-            if font_path and font_path.exists():
-                font = ImageFont.truetype(str(font_path), font_size)
-            else:
-                # Try to use default system font
-                try:
-                    font = ImageFont.truetype(
-                        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                        font_size
-                    )
-                except:
-                    font = ImageFont.load_default()
-        except Exception as e:
-            logger.warning(f"Failed to load font: {e}, using default")
-            font = ImageFont.load_default()
-
-        self.draw.text((x, y), text, fill=color, font=font)
-
-    def rectangle(
-        self,
-        x1: int,
-        y1: int,
-        x2: int,
-        y2: int,
-        fill: Optional[Tuple[int, int, int]] = None,
-        outline: Optional[Tuple[int, int, int]] = None,
-        width: int = 1
-    ) -> None:
-        """Draw a rectangle."""
-        self.draw.rectangle([(x1, y1), (x2, y2)], fill=fill, outline=outline, width=width)
-
-    def circle(
-        self,
-        x: int,
-        y: int,
-        radius: int,
-        fill: Optional[Tuple[int, int, int]] = None,
-        outline: Optional[Tuple[int, int, int]] = None,
-        width: int = 1
-    ) -> None:
-        """Draw a circle."""
-        bbox = [x - radius, y - radius, x + radius, y + radius]
-        self.draw.ellipse(bbox, fill=fill, outline=outline, width=width)
-
-    def line(
-        self,
-        x1: int,
-        y1: int,
-        x2: int,
-        y2: int,
-        color: Optional[Tuple[int, int, int]] = None,
-        width: int = 1
-    ) -> None:
-        """Draw a line."""
-        if color is None:
-            color = self.COLOR_WHITE
+    def _build_status_background(self) -> Image.Image:
+        """
+        Pre-render the static status-bar chrome.
 
-        self.draw.line([(x1, y1), (x2, y2)], fill=color, width=width)
+        Background, battery outline, battery tip, and the empty signal
+        bars never change, so they are drawn once here and blitted with
+        a single paste per status_bar() call.
 
-    def image(
-        self,
-        image_path: Path,
-        x: int,
-        y: int,
-        width: Optional[int] = None,
-        height: Optional[int] = None
-    ) -> None:
-        """Draw an image from file."""
-        try:
-            img = Image.open(image_path)
+        Returns:
+            Status bar backdrop image (WIDTH x STATUS_BAR_HEIGHT)
+        """
+        overlay = Image.new('RGB', (self.WIDTH, self.STATUS_BAR_HEIGHT), self.COLOR_DARK_GRAY)
+        draw = ImageDraw.Draw(overlay)
+
+        # Battery outline (right side)
+        draw.rectangle(
+            (self._BATTERY_X, self._BATTERY_Y,
+             self._BATTERY_X + self._BATTERY_WIDTH,
+             self._BATTERY_Y + self._BATTERY_HEIGHT),
+            outline=self.COLOR_WHITE,
+            width=1
+        )
 
-            if width and height:
-                img = img.resize((width, height), Image.Resampling.LANCZOS)
+        # Battery tip
+        draw.rectangle(
+            (self._BATTERY_X + self._BATTERY_WIDTH, self._BATTERY_Y + 3,
+             self._BATTERY_X + self._BATTERY_WIDTH + 3,
+             self._BATTERY_Y + self._BATTERY_HEIGHT - 3),
+            fill=self.COLOR_WHITE
+        )
 
-            self.buffer.paste(img, (x, y))
-        except Exception as e:
-            logger.error(f"Failed to load image {image_path}: {e}")
+        return overlay
 
     def status_bar(
         self,
@@ -188,105 +164,100 @@ class PimoroniDisplayAdapter(DisplayHAL):
         signal_strength: int = 4
     ) -> None:
         """Draw status bar at top of screen."""
-        # Draw background
-        self.rectangle(
-            0, 0,
-            self.WIDTH, self.STATUS_BAR_HEIGHT,
-            fill=self.COLOR_DARK_GRAY
-        )
-
-        # Draw time (centered)
-        time_x = (self.WIDTH - len(time_str) * 8) // 2
-        self.text(time_str, time_x, 2, color=self.COLOR_WHITE, font_size=14)
+        # Blit the pre-composed backdrop (background, battery outline and
+        # tip) in one paste instead of re-rasterizing each piece
+        self.buffer.paste(self._status_bg, (0, 0))
 
-        # Draw battery indicator (right side)
-        battery_x = self.WIDTH - 50
-        battery_y = 4
-        battery_width = 40
-        battery_height = 12
-
-        # Battery outline
-        self.rectangle(
-            battery_x, battery_y,
-            battery_x + battery_width, battery_y + battery_height,
-            outline=self.COLOR_WHITE,
-            width=1
-        )
+        # Draw time (centered against the precomputed HH:MM width)
+        self.text(time_str, self._time_x, 2, color=self.COLOR_WHITE, font_size=14)
 
-        # Battery tip
-        self.rectangle(
-            battery_x + battery_width, battery_y + 3,
-            battery_x + battery_width + 3, battery_y + battery_height - 3,
-            fill=self.COLOR_WHITE
-        )
-
-        # Battery fill
-        fill_width = int((battery_width - 4) * (battery_percent / 100))
+        # Battery fill (the only variable battery element)
+        fill_width = int((self._BATTERY_WIDTH - 4) * (battery_percent / 100))
         if fill_width > 0:
             battery_color = self.COLOR_GREEN if battery_percent > 20 else self.COLOR_RED
-            self.rectangle(
-                battery_x + 2, battery_y + 2,
-                battery_x + 2 + fill_width, battery_y + battery_height - 2,
-                fill=battery_color
+            self._fill_rect(
+                self._BATTERY_X + 2, self._BATTERY_Y + 2,
+                self._BATTERY_X + 2 + fill_width,
+                self._BATTERY_Y + self._BATTERY_HEIGHT - 2,
+                battery_color
             )
 
-        # Draw signal strength (left side)
-        signal_x = 5
-        signal_y = 8
-        bar_width = 3
-        bar_spacing = 2
-
-        for i in range(4):
-            bar_height = 4 + (i * 2)
-            bar_color = self.COLOR_WHITE if i < signal_strength else self.COLOR_DARK_GRAY
-
-            self.rectangle(
-                signal_x + (i * (bar_width + bar_spacing)),
-                signal_y + (12 - bar_height),
-                signal_x + (i * (bar_width + bar_spacing)) + bar_width,
-                signal_y + 12,
-                fill=bar_color
-            )
+        # Signal strength (left side): inactive bars match the backdrop,
+        # so only the lit ones need drawing
+        for bbox in self._SIGNAL_BAR_BBOXES[:signal_strength]:
+            self._fill_rect(*bbox, self.COLOR_WHITE)
+
+    def update(self, region: Optional[Tuple[int, int, int, int]] = None) -> None:
+        """
+        Flush buffer to physical display.
 
-    def update(self) -> None:
-        """Flush buffer to physical display."""
+        The displayhatmini driver always pushes the full frame, so the
+        region hint is accepted for HAL compatibility but ignored.
+
+        Args:
+            region: Optional (x1, y1, x2, y2) changed area (unused)
+        """
         if self.buffer is None:
             logger.warning("No buffer to display")
             return
 
         if not self.simulate and self.device:
-            try:
-                self.device.display()
-                logger.debug("Pimoroni display updated")
-            except Exception as e:
-                logger.error(f"Failed to update Pimoroni display: {e}")
+            # Diff against the last transmitted frame: periodic renders
+            # often redraw identical content, and comparing the raw
+            # buffer bytes is far cheaper than the SPI transfer
+            frame = self.buffer.tobytes()
+            if frame == self._last_frame:
+                if debug_enabled():
+                    logger.debug("Pimoroni display unchanged, skipping push")
+                return
+            self._last_frame = frame
+
+            # Copy into the front buffer and hand off to the flush
+            # thread; the copy is a memcpy, the SPI transfer is not
+            with self._flush_lock:
+                self._front_buffer.paste(self.buffer, (0, 0))
+            self._flush_event.set()
         else:
-            logger.debug("Pimoroni display update (simulated)")
+            if debug_enabled():
+                logger.debug("Pimoroni display update (simulated)")
+
+    def _flush_worker(self) -> None:
+        """
+        Push the front buffer over SPI whenever update() signals.
+
+        Runs as a daemon thread; the SPI transfer releases the GIL, so
+        the UI keeps drawing into the back buffer while this blocks.
+        """
+        while True:
+            self._flush_event.wait()
+            self._flush_event.clear()
+            if self._flush_stop:
+                break
+            with self._flush_lock:
+                try:
+                    self.device.display()
+                    if debug_enabled():
+                        logger.debug("Pimoroni display updated")
+                except Exception as e:
+                    logger.error(f"Failed to update Pimoroni display: {e}")
 
     def set_backlight(self, brightness: float) -> None:
         """Set backlight brightness (0.0 to 1.0)."""
         if not self.simulate and self.device:
             try:
                 self.device.set_backlight(brightness)
-                logger.debug(f"Pimoroni backlight set to {brightness}")
+                if debug_enabled():
+                    logger.debug(f"Pimoroni backlight set to {brightness}")
             except Exception as e:
                 logger.error(f"Failed to set Pimoroni backlight: {e}")
 
-    def get_text_size(self, text: str, font_size: int = 16) -> Tuple[int, int]:
-        """Calculate rendered text dimensions."""
-        try:
-            font = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                font_size
-            )
-        except:
-            font = ImageFont.load_default()
-
-        bbox = self.draw.textbbox((0, 0), text, font=font)
-        return (bbox[2] - bbox[0], bbox[3] - bbox[1])
-
     def cleanup(self) -> None:
         """Cleanup Pimoroni display resources."""
+        if self._flush_thread is not None:
+            self._flush_stop = True
+            self._flush_event.set()
+            self._flush_thread.join(timeout=2.0)
+
         if self.device:
             try:
                 self.device.set_backlight(0.0)  # Turn off backlight
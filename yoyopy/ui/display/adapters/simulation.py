@@ -14,28 +14,31 @@ Author: YoyoPod Team
 Date: 2025-11-30
 """
 
-from yoyopy.ui.display.display_hal import DisplayHAL
+from yoyopy.ui.display.display_hal import DisplayHAL, PillowDrawMixin
 from typing import Optional, Tuple
-from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw
 from loguru import logger
 import base64
 import io
+import struct
+import threading
+import time
 
 
-class SimulationDisplayAdapter(DisplayHAL):
+class SimulationDisplayAdapter(PillowDrawMixin, DisplayHAL):
     """
     Simulation display adapter for browser-based display.
 
     This adapter provides a pixel-perfect simulation of the Whisplay HAT
     display (240×280) rendered in a web browser using HTML5 Canvas.
 
-    All drawing operations are performed on a PIL Image buffer, which is
-    then converted to PNG and sent to the browser via WebSocket.
+    All drawing operations are performed on a PIL Image buffer, whose
+    raw bytes are sent to the browser via binary WebSocket messages.
 
     Technical Notes:
     - Uses RGB888 color format (standard RGB)
-    - Display updates are sent as base64-encoded PNG images
+    - Display updates are sent as raw RGB bytes, rate-limited and
+      coalesced to at most MAX_FPS messages per second
     - WebSocket connection managed by web server module
     """
 
@@ -45,6 +48,10 @@ class SimulationDisplayAdapter(DisplayHAL):
     ORIENTATION = "portrait"
     STATUS_BAR_HEIGHT = 25
 
+    # Upper bound on WebSocket frames per second; bursts of small draws
+    # within one interval coalesce into a single trailing send
+    MAX_FPS = 30
+
     def __init__(self, simulate: bool = True) -> None:
         """
         Initialize the simulation display adapter.
@@ -55,7 +62,40 @@ class SimulationDisplayAdapter(DisplayHAL):
         self.simulate = True  # Always in simulation mode
         self.buffer: Optional[Image.Image] = None
         self.draw: Optional[ImageDraw.ImageDraw] = None
-        self.web_server = None  # Will be set by web server module
+
+        # Web server startup is deferred to the first update(): headless
+        # runs that construct a display but never render skip the Flask
+        # import and socket setup entirely
+        self.web_server = None
+        self._web_server_lock = threading.Lock()
+        self._web_server_started = False
+
+        # Shadow of the last rendered frame (for the unchanged-frame
+        # skip) and an image copy of the last frame actually sent (for
+        # dirty-rectangle diffing against the browser's canvas state)
+        self._last_frame: Optional[bytes] = None
+        self._pending_image: Optional[Image.Image] = None
+        self._last_sent_image: Optional[Image.Image] = None
+
+        # Reused PNG scratch buffer for snapshot encoding, so repeated
+        # calls rewind instead of reallocating
+        self._png_buf = io.BytesIO()
+
+        # Background sender: update() hands the newest frame snapshot to
+        # a daemon worker that rate-limits, diffs, and pushes it, so the
+        # UI thread never blocks on the WebSocket. Latest-wins — frames
+        # rendered while a send is in flight replace the pending one.
+        self._min_send_interval = 1.0 / self.MAX_FPS
+        self._last_send_time = 0.0
+        self._send_lock = threading.Lock()
+        self._send_event = threading.Event()
+        self._send_stop = False
+        self._send_thread = threading.Thread(
+            target=self._send_worker,
+            daemon=True,
+            name="sim-display-send"
+        )
+        self._send_thread.start()
 
         # Create PIL drawing buffer
         self._create_buffer()
@@ -63,15 +103,14 @@ class SimulationDisplayAdapter(DisplayHAL):
         logger.info("Simulation display adapter initialized (240×280 portrait)")
         logger.info("Display will be available at http://localhost:5000")
 
-    def _create_buffer(self) -> None:
-        """Create a new PIL drawing buffer."""
-        self.buffer = Image.new('RGB', (self.WIDTH, self.HEIGHT), self.COLOR_BLACK)
-        self.draw = ImageDraw.Draw(self.buffer)
-
     def get_buffer_as_png_base64(self) -> str:
         """
         Convert current buffer to base64-encoded PNG.
 
+        The scratch BytesIO is rewound and reused between calls, and the
+        encode runs at compress_level=1 — snapshots of a 240×280 UI gain
+        little from deeper DEFLATE passes, so latency wins over size.
+
         Returns:
             Base64-encoded PNG image string
 
@@ -85,287 +124,16 @@ class SimulationDisplayAdapter(DisplayHAL):
         if self.buffer is None:
             self._create_buffer()
 
-        # Convert PIL Image to PNG bytes
-        buffered = io.BytesIO()
-        self.buffer.save(buffered, format="PNG")
-        png_bytes = buffered.getvalue()
+        # Convert PIL Image to PNG bytes (reusing the scratch buffer)
+        self._png_buf.seek(0)
+        self._png_buf.truncate()
+        self.buffer.save(self._png_buf, format="PNG", compress_level=1)
+        png_bytes = self._png_buf.getvalue()
 
         # Encode as base64
         b64_str = base64.b64encode(png_bytes).decode('utf-8')
         return b64_str
 
-    def clear(self, color: Optional[Tuple[int, int, int]] = None) -> None:
-        """
-        Clear the display with specified color.
-
-        Args:
-            color: RGB tuple (r, g, b) where each component is 0-255.
-                   If None, defaults to COLOR_BLACK.
-        """
-        if color is None:
-            color = self.COLOR_BLACK
-
-        if self.draw:
-            self.draw.rectangle(
-                [(0, 0), (self.WIDTH, self.HEIGHT)],
-                fill=color
-            )
-
-    def text(
-        self,
-        text: str,
-        x: int,
-        y: int,
-        color: Optional[Tuple[int, int, int]] = None,
-        font_size: int = 16,
-        font_path: Optional[Path] = None
-    ) -> None:
-        """
-        Draw text at the specified position.
-
-        Args:
-            text: The string to display
-            x: X coordinate (pixels from left)
-            y: Y coordinate (pixels from top)
-            color: RGB tuple for text color (default: COLOR_WHITE)
-            font_size: Font size in pixels
-            font_path: Optional path to TTF font file
-        """
-        if color is None:
-            color = self.COLOR_WHITE
-
-        if self.draw is None:
-            return
-
-        try:
-            # Load font
-            if font_path and font_path.exists():
-                font = ImageFont.truetype(str(font_path), font_size)
-            else:
-                # Try to load default font, fall back to PIL default
-                try:
-                    font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
-                except:
-                    font = ImageFont.load_default()
-
-            # Draw text
-            self.draw.text((x, y), text, fill=color, font=font)
-
-        except Exception as e:
-            logger.warning(f"Failed to render text: {e}")
-
-    def rectangle(
-        self,
-        x1: int,
-        y1: int,
-        x2: int,
-        y2: int,
-        fill: Optional[Tuple[int, int, int]] = None,
-        outline: Optional[Tuple[int, int, int]] = None,
-        width: int = 1
-    ) -> None:
-        """
-        Draw a rectangle.
-
-        Args:
-            x1: Top-left X coordinate
-            y1: Top-left Y coordinate
-            x2: Bottom-right X coordinate
-            y2: Bottom-right Y coordinate
-            fill: RGB tuple for fill color (None = no fill)
-            outline: RGB tuple for outline color (None = no outline)
-            width: Outline width in pixels
-        """
-        if self.draw is None:
-            return
-
-        self.draw.rectangle(
-            [(x1, y1), (x2, y2)],
-            fill=fill,
-            outline=outline,
-            width=width
-        )
-
-    def circle(
-        self,
-        x: int,
-        y: int,
-        radius: int,
-        fill: Optional[Tuple[int, int, int]] = None,
-        outline: Optional[Tuple[int, int, int]] = None,
-        width: int = 1
-    ) -> None:
-        """
-        Draw a circle.
-
-        Args:
-            x: Center X coordinate
-            y: Center Y coordinate
-            radius: Circle radius in pixels
-            fill: RGB tuple for fill color (None = no fill)
-            outline: RGB tuple for outline color (None = no outline)
-            width: Outline width in pixels
-        """
-        if self.draw is None:
-            return
-
-        bbox = [
-            x - radius,
-            y - radius,
-            x + radius,
-            y + radius
-        ]
-
-        self.draw.ellipse(
-            bbox,
-            fill=fill,
-            outline=outline,
-            width=width
-        )
-
-    def line(
-        self,
-        x1: int,
-        y1: int,
-        x2: int,
-        y2: int,
-        color: Optional[Tuple[int, int, int]] = None,
-        width: int = 1
-    ) -> None:
-        """
-        Draw a line.
-
-        Args:
-            x1: Start X coordinate
-            y1: Start Y coordinate
-            x2: End X coordinate
-            y2: End Y coordinate
-            color: RGB tuple for line color (default: COLOR_WHITE)
-            width: Line width in pixels
-        """
-        if color is None:
-            color = self.COLOR_WHITE
-
-        if self.draw is None:
-            return
-
-        self.draw.line(
-            [(x1, y1), (x2, y2)],
-            fill=color,
-            width=width
-        )
-
-    def polygon(
-        self,
-        points: list,
-        fill: Optional[Tuple[int, int, int]] = None,
-        outline: Optional[Tuple[int, int, int]] = None,
-        width: int = 1
-    ) -> None:
-        """
-        Draw a polygon.
-
-        Args:
-            points: List of (x, y) tuples defining polygon vertices
-            fill: RGB tuple for fill color (None = no fill)
-            outline: RGB tuple for outline color (None = no outline)
-            width: Outline width in pixels
-        """
-        if self.draw is None:
-            return
-
-        self.draw.polygon(
-            points,
-            fill=fill,
-            outline=outline,
-            width=width
-        )
-
-    def image(
-        self,
-        image_path: Path,
-        x: int,
-        y: int,
-        width: Optional[int] = None,
-        height: Optional[int] = None
-    ) -> None:
-        """
-        Draw an image from file.
-
-        Args:
-            image_path: Path to image file (PNG, JPG, etc.)
-            x: X coordinate (top-left corner)
-            y: Y coordinate (top-left corner)
-            width: Resize width (None to keep original)
-            height: Resize height (None to keep original)
-        """
-        if self.buffer is None:
-            return
-
-        try:
-            # Load image
-            img = Image.open(image_path)
-
-            # Resize if dimensions provided
-            if width or height:
-                # Calculate dimensions preserving aspect ratio if only one is provided
-                if width and not height:
-                    aspect = img.height / img.width
-                    height = int(width * aspect)
-                elif height and not width:
-                    aspect = img.width / img.height
-                    width = int(height * aspect)
-
-                img = img.resize((width, height), Image.Resampling.LANCZOS)
-
-            # Paste image onto buffer
-            self.buffer.paste(img, (x, y))
-
-        except Exception as e:
-            logger.warning(f"Failed to draw image {image_path}: {e}")
-
-    def get_text_size(
-        self,
-        text: str,
-        font_size: int = 16,
-        font_path: Optional[Path] = None
-    ) -> Tuple[int, int]:
-        """
-        Get the dimensions of rendered text.
-
-        Args:
-            text: The string to measure
-            font_size: Font size in pixels
-            font_path: Optional path to TTF font file
-
-        Returns:
-            Tuple of (width, height) in pixels
-        """
-        if self.draw is None:
-            return (0, 0)
-
-        try:
-            # Load font
-            if font_path and font_path.exists():
-                font = ImageFont.truetype(str(font_path), font_size)
-            else:
-                try:
-                    font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
-                except:
-                    font = ImageFont.load_default()
-
-            # Get text bounding box
-            bbox = self.draw.textbbox((0, 0), text, font=font)
-            width = bbox[2] - bbox[0]
-            height = bbox[3] - bbox[1]
-
-            return (width, height)
-
-        except Exception as e:
-            logger.warning(f"Failed to measure text: {e}")
-            # Approximate: ~10px wide per char, font_size high
-            return (len(text) * int(font_size * 0.6), font_size)
-
     def status_bar(
         self,
         time_str: str,
@@ -429,19 +197,126 @@ class SimulationDisplayAdapter(DisplayHAL):
                 fill=bar_color
             )
 
-    def update(self) -> None:
+    def update(self, region: Optional[Tuple[int, int, int, int]] = None) -> None:
         """
         Update the display by sending buffer to web browser.
 
-        This method converts the current PIL buffer to a PNG image,
-        encodes it as base64, and sends it to connected browsers via WebSocket.
+        Updates travel as binary WebSocket messages carrying an 8-byte
+        (x, y, w, h) header plus raw RGB888 bytes; the browser blits the
+        patch onto its canvas with putImageData. Each send is diffed
+        against the frame the browser last received, so typical UI
+        updates (a label, the status bar) ship only the changed
+        rectangle rather than the full frame. The region hint is not
+        needed — the pixel diff finds the changed box exactly.
+
+        Args:
+            region: Optional (x1, y1, x2, y2) changed area (unused)
         """
-        # Convert buffer to base64 PNG
-        png_data = self.get_buffer_as_png_base64()
+        if self.buffer is None:
+            return
+        self._ensure_web_server()
+        if self.web_server is None:
+            return
+
+        # Diff against the last rendered frame: idle renders often
+        # repaint identical content, and comparing raw buffer bytes is
+        # far cheaper than the WebSocket push
+        frame = self.buffer.tobytes()
+        if frame == self._last_frame:
+            return
+        self._last_frame = frame
+
+        # Snapshot the frame for the worker; it must not read the live
+        # buffer mid-draw, and later snapshots simply replace this one
+        self._pending_image = self.buffer.copy()
+        self._send_event.set()
+
+    def _ensure_web_server(self) -> None:
+        """
+        Start the browser-facing web server on first use.
+
+        Importing Flask and binding the socket cost seconds on the Pi,
+        so the work happens on the first frame that actually needs a
+        browser rather than at construction. The lock-guarded once flag
+        keeps concurrent first updates from double-starting; a failed
+        start is not retried — the adapter keeps rendering without a
+        web view, as before.
+        """
+        if self._web_server_started:
+            return
+        with self._web_server_lock:
+            if self._web_server_started:
+                return
+            self._web_server_started = True
+            try:
+                from yoyopy.ui.web_server import get_server
+                server = get_server()
+                server.start()
+                self.web_server = server
+                logger.info("Web server started - view display at http://localhost:5000")
+            except Exception as e:
+                logger.warning(f"Failed to start web server: {e}")
+                logger.warning("Simulation display will work without web view")
+
+    def _send_frame(self) -> None:
+        """Send the pending frame as a dirty-rectangle patch message."""
+        img = self._pending_image
+        if img is None:
+            return
 
-        # Send to web server (if available)
-        if self.web_server:
-            self.web_server.send_display_update(png_data)
+        if self._last_sent_image is None:
+            bbox = (0, 0, img.width, img.height)
+        else:
+            # Exact changed bounding box relative to what the browser
+            # is currently showing; None means nothing visibly changed
+            bbox = ImageChops.difference(img, self._last_sent_image).getbbox()
+            if bbox is None:
+                self._last_sent_image = img
+                return
+
+        x1, y1, x2, y2 = bbox
+        full = bbox == (0, 0, img.width, img.height)
+        patch = img if full else img.crop(bbox)
+        header = struct.pack('>HHHH', x1, y1, x2 - x1, y2 - y1)
+        payload = header + patch.tobytes()
+
+        if full:
+            self.web_server.send_display_update(payload)
+        else:
+            # Late-connecting browsers need the whole frame, so hand the
+            # server a full snapshot to cache alongside the patch
+            snapshot = struct.pack('>HHHH', 0, 0, img.width, img.height) + img.tobytes()
+            self.web_server.send_display_update(payload, full_frame=snapshot)
+        self._last_sent_image = img
+
+    def _send_worker(self) -> None:
+        """
+        Push pending frames from a daemon thread whenever update()
+        signals, holding back to the MAX_FPS interval. Anything rendered
+        during the wait coalesces into the single send that follows.
+        """
+        while True:
+            self._send_event.wait()
+            self._send_event.clear()
+            if self._send_stop:
+                break
+
+            wait = self._min_send_interval - (time.monotonic() - self._last_send_time)
+            if wait > 0:
+                time.sleep(wait)
+                self._send_event.clear()
+                if self._send_stop:
+                    break
+
+            self._last_send_time = time.monotonic()
+            with self._send_lock:
+                self._send_frame()
+
+    def flush(self) -> None:
+        """Send any pending coalesced frame immediately."""
+        with self._send_lock:
+            self._last_send_time = time.monotonic()
+            self._send_frame()
 
     def set_backlight(self, brightness: float) -> None:
         """
@@ -455,6 +330,9 @@ class SimulationDisplayAdapter(DisplayHAL):
 
     def cleanup(self) -> None:
         """Clean up display resources."""
+        self._send_stop = True
+        self._send_event.set()
+        self._send_thread.join(timeout=2.0)
         self.buffer = None
         self.draw = None
         logger.info("Simulation display adapter cleaned up")
@@ -16,13 +16,23 @@ Author: YoyoPod Team
 Date: 2025-11-30
 """
 
-from yoyopy.ui.display.display_hal import DisplayHAL
+from yoyopy.ui.display.display_hal import DisplayHAL, PillowDrawMixin
 from typing import Optional, Tuple
-from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw
 from loguru import logger
 import sys
 
+from yoyopy.utils.logger import debug_enabled
+
+# Per-channel lookup tables for the RGB888 -> RGB565 big-endian split:
+# high byte = (r & 0xF8) | (g >> 5), low byte = ((g & 0x1C) << 3) | (b >> 3).
+# The two contributions to each byte occupy disjoint bits, so combining
+# them with a saturating add can never carry.
+_RGB565_HI_R = bytes(v & 0xF8 for v in range(256))
+_RGB565_HI_G = bytes(v >> 5 for v in range(256))
+_RGB565_LO_G = bytes((v & 0x1C) << 3 for v in range(256))
+_RGB565_LO_B = bytes(v >> 3 for v in range(256))
+
 # Add Whisplay driver to Python path
 sys.path.append("/home/tifo/Whisplay/Driver")
 
@@ -34,7 +44,7 @@ except ImportError:
     logger.warning("WhisPlay library not available - adapter will run in simulation mode")
 
 
-class WhisplayDisplayAdapter(DisplayHAL):
+class WhisplayDisplayAdapter(PillowDrawMixin, DisplayHAL):
     """
     Hardware adapter for PiSugar Whisplay HAT.
 
@@ -72,6 +82,10 @@ class WhisplayDisplayAdapter(DisplayHAL):
         # Create PIL drawing buffer
         self._create_buffer()
 
+        # Signal strength only takes values 0-4, so pre-render all five
+        # bar combinations once and blit the right one per refresh
+        self._signal_imgs = tuple(self._render_signal(level) for level in range(5))
+
         if not self.simulate:
             try:
                 # Initialize WhisPlay board
@@ -88,140 +102,70 @@ class WhisplayDisplayAdapter(DisplayHAL):
         else:
             logger.info("Whisplay display adapter running in simulation mode")
 
-    def _create_buffer(self) -> None:
-        """Create a new PIL drawing buffer."""
-        self.buffer = Image.new('RGB', (self.WIDTH, self.HEIGHT), self.COLOR_BLACK)
-        self.draw = ImageDraw.Draw(self.buffer)
-
-    def _convert_to_rgb565(self) -> bytes:
+    def _render_signal(self, signal_strength: int) -> Image.Image:
         """
-        Convert PIL RGB888 buffer to RGB565 byte array for Whisplay display.
+        Pre-render the four signal bars for one strength level.
 
-        RGB565 format:
-        - 5 bits for red
-        - 6 bits for green
-        - 5 bits for blue
-        - Total: 16 bits (2 bytes) per pixel
+        Args:
+            signal_strength: Number of lit bars (0-4)
 
         Returns:
-            Byte array in RGB565 format (big-endian)
+            Bar cluster image, blitted into the status bar with one paste
         """
-        pixel_data = []
-
-        for y in range(self.HEIGHT):
-            for x in range(self.WIDTH):
-                # Get RGB888 pixel from PIL buffer
-                r, g, b = self.buffer.getpixel((x, y))
-
-                # Convert to RGB565
-                # R: 8 bits -> 5 bits (keep upper 5 bits)
-                # G: 8 bits -> 6 bits (keep upper 6 bits)
-                # B: 8 bits -> 5 bits (keep upper 5 bits)
-                rgb565 = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
-
-                # Split into 2 bytes (big-endian)
-                pixel_data.extend([(rgb565 >> 8) & 0xFF, rgb565 & 0xFF])
+        bar_width = 3
+        bar_spacing = 2
 
-        return bytes(pixel_data)
+        # Inclusive ImageDraw coordinates: the cluster spans x 0..18 and
+        # y 0..12 in local space
+        img = Image.new('RGB', (19, 13), self.COLOR_DARK_GRAY)
+        draw = ImageDraw.Draw(img)
 
-    def clear(self, color: Optional[Tuple[int, int, int]] = None) -> None:
-        """Clear the display with specified color."""
-        if color is None:
-            color = self.COLOR_BLACK
+        for i in range(4):
+            bar_height = 4 + (i * 2)
+            bar_color = self.COLOR_WHITE if i < signal_strength else self.COLOR_DARK_GRAY
+            x = i * (bar_width + bar_spacing)
+            draw.rectangle(
+                (x, 12 - bar_height, x + bar_width, 12),
+                fill=bar_color
+            )
 
-        self.draw.rectangle([(0, 0), (self.WIDTH, self.HEIGHT)], fill=color)
-        logger.debug(f"Whisplay display cleared with color {color}")
+        return img
 
-    def text(
+    def _convert_to_rgb565(
         self,
-        text: str,
-        x: int,
-        y: int,
-        color: Optional[Tuple[int, int, int]] = None,
-        font_size: int = 16,
-        font_path: Optional[Path] = None
-    ) -> None:
-        """Draw text at specified position."""
-        if color is None:
-            color = self.COLOR_WHITE
-
-        try:
-            if font_path and font_path.exists():
-                font = ImageFont.truetype(str(font_path), font_size)
-            else:
-                # Try to use default system font
-                try:
-                    font = ImageFont.truetype(
-                        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                        font_size
-                    )
-                except:
-                    font = ImageFont.load_default()
-        except Exception as e:
-            logger.warning(f"Failed to load font: {e}, using default")
-            font = ImageFont.load_default()
-
-        self.draw.text((x, y), text, fill=color, font=font)
-
-    def rectangle(
-        self,
-        x1: int,
-        y1: int,
-        x2: int,
-        y2: int,
-        fill: Optional[Tuple[int, int, int]] = None,
-        outline: Optional[Tuple[int, int, int]] = None,
-        width: int = 1
-    ) -> None:
-        """Draw a rectangle."""
-        self.draw.rectangle([(x1, y1), (x2, y2)], fill=fill, outline=outline, width=width)
+        region: Optional[Tuple[int, int, int, int]] = None
+    ) -> bytes:
+        """
+        Convert PIL RGB888 buffer to RGB565 byte array for Whisplay display.
 
-    def circle(
-        self,
-        x: int,
-        y: int,
-        radius: int,
-        fill: Optional[Tuple[int, int, int]] = None,
-        outline: Optional[Tuple[int, int, int]] = None,
-        width: int = 1
-    ) -> None:
-        """Draw a circle."""
-        bbox = [x - radius, y - radius, x + radius, y + radius]
-        self.draw.ellipse(bbox, fill=fill, outline=outline, width=width)
+        RGB565 format:
+        - 5 bits for red
+        - 6 bits for green
+        - 5 bits for blue
+        - Total: 16 bits (2 bytes) per pixel
 
-    def line(
-        self,
-        x1: int,
-        y1: int,
-        x2: int,
-        y2: int,
-        color: Optional[Tuple[int, int, int]] = None,
-        width: int = 1
-    ) -> None:
-        """Draw a line."""
-        if color is None:
-            color = self.COLOR_WHITE
+        The conversion runs entirely in Pillow's C layer: per-channel
+        256-entry lookup tables map each band to its contribution, the
+        bytes of each half are combined with a carry-free add, and an
+        'LA' merge interleaves high/low bytes in one pass. This replaced
+        a per-pixel Python loop that took tens of milliseconds per frame.
 
-        self.draw.line([(x1, y1), (x2, y2)], fill=color, width=width)
+        Args:
+            region: Optional (x1, y1, x2, y2) area to convert; defaults
+                    to the full buffer
 
-    def image(
-        self,
-        image_path: Path,
-        x: int,
-        y: int,
-        width: Optional[int] = None,
-        height: Optional[int] = None
-    ) -> None:
-        """Draw an image from file."""
-        try:
-            img = Image.open(image_path)
+        Returns:
+            Byte array in RGB565 format (big-endian)
+        """
+        source = self.buffer if region is None else self.buffer.crop(region)
+        r, g, b = source.split()
 
-            if width and height:
-                img = img.resize((width, height), Image.Resampling.LANCZOS)
+        high = ImageChops.add(r.point(_RGB565_HI_R), g.point(_RGB565_HI_G))
+        low = ImageChops.add(g.point(_RGB565_LO_G), b.point(_RGB565_LO_B))
 
-            self.buffer.paste(img, (x, y))
-        except Exception as e:
-            logger.error(f"Failed to load image {image_path}: {e}")
+        # tobytes on an LA image emits the two bands interleaved per
+        # pixel, which is exactly the big-endian RGB565 byte stream
+        return Image.merge('LA', (high, low)).tobytes()
 
     def status_bar(
         self,
@@ -277,29 +221,20 @@ class WhisplayDisplayAdapter(DisplayHAL):
                 fill=battery_color
             )
 
-        # Draw signal strength (left side)
-        signal_x = 5
-        signal_y = 10
-        bar_width = 3
-        bar_spacing = 2
+        # Draw signal strength (left side): one blit of the pre-rendered
+        # bar cluster instead of four rectangle calls
+        self.buffer.paste(self._signal_imgs[signal_strength], (5, 10))
 
-        for i in range(4):
-            bar_height = 4 + (i * 2)
-            bar_color = self.COLOR_WHITE if i < signal_strength else self.COLOR_DARK_GRAY
-
-            self.rectangle(
-                signal_x + (i * (bar_width + bar_spacing)),
-                signal_y + (12 - bar_height),
-                signal_x + (i * (bar_width + bar_spacing)) + bar_width,
-                signal_y + 12,
-                fill=bar_color
-            )
-
-    def update(self) -> None:
+    def update(self, region: Optional[Tuple[int, int, int, int]] = None) -> None:
         """
         Flush buffer to physical display.
 
         Converts RGB888 PIL buffer to RGB565 format and sends to Whisplay display.
+        When a region is given, only that rectangle is converted and pushed,
+        which cuts the SPI transfer to the changed pixels.
+
+        Args:
+            region: Optional (x1, y1, x2, y2) changed area
         """
         if self.buffer is None:
             logger.warning("No buffer to display")
@@ -307,16 +242,21 @@ class WhisplayDisplayAdapter(DisplayHAL):
 
         if not self.simulate and self.device:
             try:
-                # Convert PIL buffer to RGB565 byte array
-                pixel_data = self._convert_to_rgb565()
-
-                # Send to Whisplay display
-                self.device.draw_image(0, 0, self.WIDTH, self.HEIGHT, pixel_data)
-                logger.debug("Whisplay display updated")
+                # Convert PIL buffer to RGB565 byte array and send only
+                # the requested rectangle to the Whisplay display
+                pixel_data = self._convert_to_rgb565(region)
+                if region is None:
+                    self.device.draw_image(0, 0, self.WIDTH, self.HEIGHT, pixel_data)
+                else:
+                    x1, y1, x2, y2 = region
+                    self.device.draw_image(x1, y1, x2 - x1, y2 - y1, pixel_data)
+                if debug_enabled():
+                    logger.debug("Whisplay display updated")
             except Exception as e:
                 logger.error(f"Failed to update Whisplay display: {e}")
         else:
-            logger.debug("Whisplay display update (simulated)")
+            if debug_enabled():
+                logger.debug("Whisplay display update (simulated)")
 
     def set_backlight(self, brightness: float) -> None:
         """
@@ -329,23 +269,11 @@ class WhisplayDisplayAdapter(DisplayHAL):
                 # Convert 0.0-1.0 to 0-100
                 whisplay_brightness = int(brightness * 100)
                 self.device.set_backlight(whisplay_brightness)
-                logger.debug(f"Whisplay backlight set to {brightness} ({whisplay_brightness}%)")
+                if debug_enabled():
+                    logger.debug(f"Whisplay backlight set to {brightness} ({whisplay_brightness}%)")
             except Exception as e:
                 logger.error(f"Failed to set Whisplay backlight: {e}")
 
-    def get_text_size(self, text: str, font_size: int = 16) -> Tuple[int, int]:
-        """Calculate rendered text dimensions."""
-        try:
-            font = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                font_size
-            )
-        except:
-            font = ImageFont.load_default()
-
-        bbox = self.draw.textbbox((0, 0), text, font=font)
-        return (bbox[2] - bbox[0], bbox[3] - bbox[1])
-
     def cleanup(self) -> None:
         """Cleanup Whisplay display resources."""
         if self.device:
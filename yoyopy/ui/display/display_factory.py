@@ -15,13 +15,32 @@ Date: 2025-11-30
 """
 
 from yoyopy.ui.display.display_hal import DisplayHAL
-from yoyopy.ui.display.adapters.pimoroni import PimoroniDisplayAdapter
-from yoyopy.ui.display.adapters.whisplay import WhisplayDisplayAdapter
-from yoyopy.ui.display.adapters.simulation import SimulationDisplayAdapter
+from dataclasses import dataclass
 from loguru import logger
+from functools import lru_cache
+import importlib.util
 import os
 
 
+@dataclass(frozen=True, slots=True)
+class HardwareInfo:
+    """
+    Immutable record describing a display adapter's configuration.
+
+    Computed once per adapter by get_hardware_info() — a fixed-size
+    slots struct instead of a fresh dict per call, so polling it from a
+    status loop allocates nothing after the first call.
+    """
+
+    type: str
+    width: int
+    height: int
+    orientation: str
+    status_bar_height: int
+    simulated: bool
+
+
+@lru_cache(maxsize=1)
 def detect_hardware() -> str:
     """
     Auto-detect which display hardware is connected.
@@ -32,6 +51,11 @@ def detect_hardware() -> str:
     3. Check for DisplayHATMini library availability
     4. Default to simulation mode
 
+    The attached hardware cannot change while the process runs, so the
+    result is cached: repeated Display constructions skip the stat and
+    import probing. Tests that change YOYOPOD_DISPLAY can reset with
+    detect_hardware.cache_clear().
+
     Returns:
         Hardware type: "whisplay", "pimoroni", or "simulation"
 
@@ -56,13 +80,13 @@ def detect_hardware() -> str:
         logger.info(f"Detected Whisplay HAT (driver found at {whisplay_driver_path})")
         return "whisplay"
 
-    # Priority 3: Check for Pimoroni library
-    try:
-        import displayhatmini
-        logger.info("Detected Pimoroni Display HAT Mini (library imported successfully)")
+    # Priority 3: Check for Pimoroni library. find_spec only locates the
+    # package rather than executing its top-level code (which would spin
+    # up GPIO/SPI); the actual import is deferred to the adapter. The
+    # lru_cache above keeps even this probe to once per process.
+    if importlib.util.find_spec("displayhatmini") is not None:
+        logger.info("Detected Pimoroni Display HAT Mini (library found)")
         return "pimoroni"
-    except ImportError:
-        pass
 
     # Priority 4: No hardware detected, default to simulation
     logger.warning("No display hardware detected - defaulting to simulation mode")
@@ -70,6 +94,43 @@ def detect_hardware() -> str:
     return "simulation"
 
 
+def _make_whisplay(simulate: bool) -> DisplayHAL:
+    """Build the Whisplay adapter, importing it on demand."""
+    from yoyopy.ui.display.adapters.whisplay import WhisplayDisplayAdapter
+
+    logger.info("Creating Whisplay display adapter (240×280 portrait)")
+    return WhisplayDisplayAdapter(simulate=simulate)
+
+
+def _make_pimoroni(simulate: bool) -> DisplayHAL:
+    """Build the Pimoroni adapter, importing it on demand."""
+    from yoyopy.ui.display.adapters.pimoroni import PimoroniDisplayAdapter
+
+    logger.info("Creating Pimoroni display adapter (320×240 landscape)")
+    return PimoroniDisplayAdapter(simulate=simulate)
+
+
+def _make_simulation(simulate: bool) -> DisplayHAL:
+    """Build the simulation adapter, importing it on demand."""
+    from yoyopy.ui.display.adapters.simulation import SimulationDisplayAdapter
+
+    logger.info("Creating simulation display adapter (240×280 portrait)")
+    # The adapter starts its web server lazily on the first update(),
+    # so headless constructions stay cheap
+    return SimulationDisplayAdapter(simulate=True)
+
+
+# Dispatch table for get_display(): one dict lookup instead of a string
+# compare ladder. Each factory imports its own adapter, so only the
+# selected adapter's dependency tree (hardware driver libs, or Flask
+# for the simulation web server) is ever loaded.
+_ADAPTER_FACTORIES = {
+    "whisplay": _make_whisplay,
+    "pimoroni": _make_pimoroni,
+    "simulation": _make_simulation,
+}
+
+
 def get_display(hardware: str = "auto", simulate: bool = False) -> DisplayHAL:
     """
     Factory function to create the appropriate display adapter.
@@ -117,61 +178,39 @@ def get_display(hardware: str = "auto", simulate: bool = False) -> DisplayHAL:
         hardware = "simulation"
         logger.info("Forcing simulation mode (--simulate flag)")
 
-    # Auto-detect if requested (and not already forced to simulation)
+    # Auto-detect if requested (and not already forced to simulation);
+    # detect_hardware() already returns a normalized lowercase value,
+    # so only caller-provided strings need the lower() pass
     if hardware == "auto":
         hardware = detect_hardware()
-
-    # Normalize to lowercase
-    hardware = hardware.lower()
-
-    # Create appropriate adapter
-    if hardware == "whisplay":
-        logger.info("Creating Whisplay display adapter (240×280 portrait)")
-        return WhisplayDisplayAdapter(simulate=simulate)
-
-    elif hardware == "pimoroni":
-        logger.info("Creating Pimoroni display adapter (320×240 landscape)")
-        return PimoroniDisplayAdapter(simulate=simulate)
-
-    elif hardware == "simulation":
-        logger.info("Creating simulation display adapter (240×280 portrait)")
-        # Use dedicated simulation adapter with web server support
-        adapter = SimulationDisplayAdapter(simulate=True)
-
-        # Start web server for browser display
-        if simulate or hardware == "simulation":
-            try:
-                from yoyopy.ui.web_server import get_server
-                server = get_server()
-                adapter.web_server = server
-                server.start()
-                logger.info("Web server started - view display at http://localhost:5000")
-            except Exception as e:
-                logger.warning(f"Failed to start web server: {e}")
-                logger.warning("Simulation display will work without web view")
-
-        return adapter
-
     else:
-        # Unknown hardware type
-        valid_types = ["auto", "whisplay", "pimoroni", "simulation"]
+        hardware = hardware.lower()
+
+    try:
+        factory = _ADAPTER_FACTORIES[hardware]
+    except KeyError:
+        valid_types = ["auto", *_ADAPTER_FACTORIES]
         raise ValueError(
             f"Unknown display hardware type: '{hardware}'. "
             f"Valid options: {', '.join(valid_types)}"
-        )
+        ) from None
+
+    return factory(simulate)
 
 
-def get_hardware_info(adapter: DisplayHAL) -> dict:
+def get_hardware_info(adapter: DisplayHAL) -> HardwareInfo:
     """
     Get information about a display adapter.
 
-    Useful for debugging and logging hardware configuration.
+    Useful for debugging and logging hardware configuration. The record
+    is built once and cached on the adapter, so repeated calls return
+    the same immutable HardwareInfo instance.
 
     Args:
         adapter: Display adapter instance
 
     Returns:
-        Dictionary with hardware information:
+        HardwareInfo record with:
             - type: Adapter class name
             - width: Display width in pixels
             - height: Display height in pixels
@@ -182,21 +221,21 @@ def get_hardware_info(adapter: DisplayHAL) -> dict:
     Example:
         >>> display = get_display()
         >>> info = get_hardware_info(display)
-        >>> print(info)
-        {
-            'type': 'WhisplayDisplayAdapter',
-            'width': 240,
-            'height': 280,
-            'orientation': 'portrait',
-            'status_bar_height': 25,
-            'simulated': False
-        }
+        >>> print(f"{info.type}: {info.width}x{info.height}")
+        WhisplayDisplayAdapter: 240x280
     """
-    return {
-        'type': adapter.__class__.__name__,
-        'width': adapter.WIDTH,
-        'height': adapter.HEIGHT,
-        'orientation': adapter.ORIENTATION,
-        'status_bar_height': adapter.STATUS_BAR_HEIGHT,
-        'simulated': adapter.simulate
-    }
+    try:
+        return adapter._hw_info
+    except AttributeError:
+        pass
+
+    info = HardwareInfo(
+        type=adapter.__class__.__name__,
+        width=adapter.WIDTH,
+        height=adapter.HEIGHT,
+        orientation=adapter.ORIENTATION,
+        status_bar_height=adapter.STATUS_BAR_HEIGHT,
+        simulated=adapter.simulate,
+    )
+    adapter._hw_info = info
+    return info
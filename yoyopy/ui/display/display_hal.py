@@ -9,21 +9,32 @@ Author: YoyoPod Team
 Date: 2025-11-30
 """
 
-from abc import ABC, abstractmethod
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import ClassVar, Final, Tuple, Optional
 from pathlib import Path
 
+from PIL import Image, ImageDraw, ImageFont
+from loguru import logger
 
-class DisplayHAL(ABC):
+from yoyopy.utils.logger import debug_enabled
+
+
+class DisplayHAL:
     """
-    Abstract base class for display hardware adapters.
+    Base class for display hardware adapters.
 
-    All display implementations (Pimoroni, Whisplay, etc.) must inherit
-    from this class and implement all abstract methods.
+    All display implementations (Pimoroni, Whisplay, etc.) inherit from
+    this class and override every method that raises NotImplementedError.
 
     This ensures a consistent API across different hardware backends,
     allowing the rest of the application to remain hardware-agnostic.
 
+    A plain class is used deliberately instead of abc.ABC: adapters are
+    only ever constructed through the factory, so ABCMeta's per-subclass
+    __abstractmethods__ bookkeeping and per-instantiation checks buy
+    nothing here — a missing override still fails loudly, just at first
+    call instead of construction.
+
     Attributes:
         WIDTH: Display width in pixels
         HEIGHT: Display height in pixels
@@ -32,25 +43,28 @@ class DisplayHAL(ABC):
         COLOR_*: Standard RGB color constants
     """
 
-    # Display dimensions (must be set by subclass)
-    WIDTH: int = 0
-    HEIGHT: int = 0
-    ORIENTATION: str = "landscape"  # "landscape" or "portrait"
-    STATUS_BAR_HEIGHT: int = 20
-
-    # Standard color palette (RGB tuples)
-    COLOR_BLACK = (0, 0, 0)
-    COLOR_WHITE = (255, 255, 255)
-    COLOR_RED = (255, 0, 0)
-    COLOR_GREEN = (0, 255, 0)
-    COLOR_BLUE = (0, 0, 255)
-    COLOR_YELLOW = (255, 255, 0)
-    COLOR_CYAN = (0, 255, 255)
-    COLOR_MAGENTA = (255, 0, 255)
-    COLOR_GRAY = (128, 128, 128)
-    COLOR_DARK_GRAY = (64, 64, 64)
-
-    @abstractmethod
+    # Display dimensions: per-adapter class constants, never written on
+    # instances (ClassVar; each subclass overrides, so Final would be
+    # wrong here)
+    WIDTH: ClassVar[int] = 0
+    HEIGHT: ClassVar[int] = 0
+    ORIENTATION: ClassVar[str] = "landscape"  # "landscape" or "portrait"
+    STATUS_BAR_HEIGHT: ClassVar[int] = 20
+
+    # Standard color palette. One tuple object per color, shared by
+    # every adapter through the MRO — subclasses and instances hold no
+    # copies, and Final marks them as never reassigned
+    COLOR_BLACK: Final = (0, 0, 0)
+    COLOR_WHITE: Final = (255, 255, 255)
+    COLOR_RED: Final = (255, 0, 0)
+    COLOR_GREEN: Final = (0, 255, 0)
+    COLOR_BLUE: Final = (0, 0, 255)
+    COLOR_YELLOW: Final = (255, 255, 0)
+    COLOR_CYAN: Final = (0, 255, 255)
+    COLOR_MAGENTA: Final = (255, 0, 255)
+    COLOR_GRAY: Final = (128, 128, 128)
+    COLOR_DARK_GRAY: Final = (64, 64, 64)
+
     def __init__(self, simulate: bool = False) -> None:
         """
         Initialize the display hardware.
@@ -58,9 +72,8 @@ class DisplayHAL(ABC):
         Args:
             simulate: If True, run in simulation mode without hardware
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def clear(self, color: Optional[Tuple[int, int, int]] = None) -> None:
         """
         Clear the display with specified color.
@@ -69,9 +82,8 @@ class DisplayHAL(ABC):
             color: RGB tuple (r, g, b) where each component is 0-255.
                    If None, defaults to COLOR_BLACK.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def text(
         self,
         text: str,
@@ -92,9 +104,8 @@ class DisplayHAL(ABC):
             font_size: Font size in pixels
             font_path: Optional path to TTF font file
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def rectangle(
         self,
         x1: int,
@@ -115,9 +126,8 @@ class DisplayHAL(ABC):
             outline: RGB tuple for border color (None for no border)
             width: Border width in pixels
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def circle(
         self,
         x: int,
@@ -137,9 +147,8 @@ class DisplayHAL(ABC):
             outline: RGB tuple for border color (None for no border)
             width: Border width in pixels
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def line(
         self,
         x1: int,
@@ -158,9 +167,8 @@ class DisplayHAL(ABC):
             color: RGB tuple for line color (default: COLOR_WHITE)
             width: Line width in pixels
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def image(
         self,
         image_path: Path,
@@ -178,9 +186,8 @@ class DisplayHAL(ABC):
             width: Resize width (None to keep original)
             height: Resize height (None to keep original)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def status_bar(
         self,
         time_str: str = "--:--",
@@ -200,20 +207,24 @@ class DisplayHAL(ABC):
             battery_percent: Battery level 0-100
             signal_strength: Signal bars 0-4 (0=no signal, 4=full)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
-    def update(self) -> None:
+    def update(self, region: Optional[Tuple[int, int, int, int]] = None) -> None:
         """
         Flush the drawing buffer to the physical display.
 
         This method must be called after drawing operations to make
         changes visible on the screen. Implementations typically use
         double-buffering for flicker-free updates.
+
+        Args:
+            region: Optional (x1, y1, x2, y2) bounding box of the area
+                    that changed. Adapters that support partial refresh
+                    push only those pixels; others may ignore the hint
+                    and flush the full buffer.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def set_backlight(self, brightness: float) -> None:
         """
         Set display backlight brightness.
@@ -221,9 +232,8 @@ class DisplayHAL(ABC):
         Args:
             brightness: Brightness level from 0.0 (off) to 1.0 (max)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_text_size(self, text: str, font_size: int = 16) -> Tuple[int, int]:
         """
         Calculate the size of rendered text.
@@ -237,9 +247,8 @@ class DisplayHAL(ABC):
         Returns:
             (width, height) tuple in pixels
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def cleanup(self) -> None:
         """
         Cleanup hardware resources on shutdown.
@@ -250,7 +259,23 @@ class DisplayHAL(ABC):
         - Release GPIO pins
         - Free any allocated memory
         """
-        pass
+        raise NotImplementedError
+
+    # Derived geometry, computed once per adapter class. WIDTH, HEIGHT,
+    # ORIENTATION and STATUS_BAR_HEIGHT are fixed class attributes, so
+    # the helpers below return these precomputed values instead of
+    # redoing the arithmetic and string compare on every call.
+    _IS_PORTRAIT: ClassVar[bool] = False
+    _IS_LANDSCAPE: ClassVar[bool] = True
+    _DIMENSIONS: ClassVar[Tuple[int, int]] = (0, 0)
+    _USABLE_HEIGHT: ClassVar[int] = -20
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._IS_PORTRAIT = cls.ORIENTATION == "portrait"
+        cls._IS_LANDSCAPE = cls.ORIENTATION == "landscape"
+        cls._DIMENSIONS = (cls.WIDTH, cls.HEIGHT)
+        cls._USABLE_HEIGHT = cls.HEIGHT - cls.STATUS_BAR_HEIGHT
 
     # Helper methods (default implementations, can be overridden)
     def get_orientation(self) -> str:
@@ -269,7 +294,7 @@ class DisplayHAL(ABC):
         Returns:
             True if HEIGHT > WIDTH
         """
-        return self.ORIENTATION == "portrait"
+        return self._IS_PORTRAIT
 
     def is_landscape(self) -> bool:
         """
@@ -278,7 +303,7 @@ class DisplayHAL(ABC):
         Returns:
             True if WIDTH > HEIGHT
         """
-        return self.ORIENTATION == "landscape"
+        return self._IS_LANDSCAPE
 
     def get_dimensions(self) -> Tuple[int, int]:
         """
@@ -287,7 +312,7 @@ class DisplayHAL(ABC):
         Returns:
             (width, height) tuple in pixels
         """
-        return (self.WIDTH, self.HEIGHT)
+        return self._DIMENSIONS
 
     def get_usable_height(self) -> int:
         """
@@ -296,4 +321,243 @@ class DisplayHAL(ABC):
         Returns:
             Height in pixels available for content
         """
-        return self.HEIGHT - self.STATUS_BAR_HEIGHT
+        return self._USABLE_HEIGHT
+
+
+@lru_cache(maxsize=64)
+def _load_resized(
+    path_str: str,
+    width: Optional[int],
+    height: Optional[int],
+    mtime: float
+) -> Image.Image:
+    """
+    Load and optionally resize an image, cached per (path, size, mtime).
+
+    Decoding plus a resize is far too expensive to repeat for icons and
+    cover art that get redrawn every frame; the mtime key makes the
+    cache self-invalidating when a file changes on disk. Image.open is
+    lazy, but convert('RGB') forces the full decode and releases the
+    file descriptor, so cached entries are completely loaded and a
+    cache hit costs nothing beyond the paste.
+
+    Large downscales go through Pillow's integer box reduce first, then
+    a bilinear pass to the exact target — these small panels cannot
+    resolve the extra fidelity a Lanczos filter would buy, and this
+    chain is several times cheaper on the Pi Zero.
+
+    Args:
+        path_str: Path to the image file
+        width: Target width, or None to keep the original size
+        height: Target height, or None to keep the original size
+        mtime: File modification time (cache key only)
+
+    Returns:
+        Decoded image, resized if dimensions were given
+    """
+    img = Image.open(path_str).convert('RGB')
+    if width and height:
+        # Reduce by the largest integer factor that still leaves both
+        # dimensions at or above the target, then bilinear to size
+        scale = min(img.width // width, img.height // height)
+        if scale > 2:
+            img = img.reduce(scale)
+        img = img.resize((width, height), Image.Resampling.BILINEAR)
+    return img
+
+
+class PillowDrawMixin:
+    """
+    Shared Pillow-backed drawing primitives for display adapters.
+
+    Every adapter renders into a PIL buffer and only differs in how the
+    finished frame reaches the panel (SPI push, WebSocket, ...), so the
+    buffer management and drawing primitives live here exactly once.
+    That also means the font and image caches are shared: a performance
+    fix lands in one place instead of being copied per adapter.
+
+    Subclasses must provide WIDTH/HEIGHT/COLOR_* (from DisplayHAL) and
+    implement update()/set_backlight()/cleanup() plus any layout-specific
+    chrome such as status_bar().
+    """
+
+    buffer: Optional[Image.Image] = None
+    draw: Optional[ImageDraw.ImageDraw] = None
+
+    def _create_buffer(self) -> None:
+        """
+        Create the PIL drawing buffer and its ImageDraw context.
+
+        Called from __init__ only: the buffer and draw object live for
+        the adapter's lifetime, and clear() repaints in place rather
+        than reallocating either.
+        """
+        self.buffer = Image.new('RGB', (self.WIDTH, self.HEIGHT), self.COLOR_BLACK)
+        self.draw = ImageDraw.Draw(self.buffer)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _get_font(font_path: Optional[str], font_size: int) -> ImageFont.FreeTypeFont:
+        """
+        Load and cache a font for the given (path, size) pair.
+
+        ImageFont.truetype re-parses the TTF file on every call, which
+        is far too slow for the per-frame text path; caching here means
+        each font is loaded from disk exactly once per process.
+
+        Font availability is probed EAFP-style: no exists() stat on the
+        draw path, just a truetype attempt whose failure cost is paid at
+        most once per (path, size) thanks to the cache.
+
+        Args:
+            font_path: Path to a TTF font file, or None for the default
+            font_size: Font size in pixels
+
+        Returns:
+            Shared ImageFont instance
+        """
+        if font_path:
+            try:
+                return ImageFont.truetype(font_path, font_size)
+            except OSError as e:
+                logger.warning(f"Failed to load font {font_path}: {e}, using default")
+        try:
+            return ImageFont.truetype(
+                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+                font_size
+            )
+        except OSError as e:
+            logger.warning(f"Failed to load font: {e}, using default")
+            return ImageFont.load_default()
+
+    def _fill_rect(self, x1: int, y1: int, x2: int, y2: int,
+                   color: Tuple[int, int, int]) -> None:
+        """
+        Fill a solid rectangle via Pillow's C-level paste.
+
+        Cheaper than ImageDraw.rectangle for known-solid boxes: no
+        outline/width handling, just a contiguous block fill.
+        Coordinates are inclusive, matching ImageDraw's convention.
+
+        Args:
+            x1, y1: Top-left corner
+            x2, y2: Bottom-right corner (inclusive)
+            color: RGB fill color
+        """
+        self.buffer.paste(color, (x1, y1, x2 + 1, y2 + 1))
+
+    def clear(self, color: Optional[Tuple[int, int, int]] = None) -> None:
+        """Clear the display with specified color."""
+        if color is None:
+            color = self.COLOR_BLACK
+
+        # Image.paste with a color is an optimized C-level fill of the
+        # existing buffer — no rectangle rasterization, no reallocation
+        self.buffer.paste(color, (0, 0, self.WIDTH, self.HEIGHT))
+        if debug_enabled():
+            logger.debug(f"Display cleared with color {color}")
+
+    def text(
+        self,
+        text: str,
+        x: int,
+        y: int,
+        color: Optional[Tuple[int, int, int]] = None,
+        font_size: int = 16,
+        font_path: Optional[Path] = None
+    ) -> None:
+        """Draw text at specified position."""
+        if color is None:
+            color = self.COLOR_WHITE
+
+        font = self._get_font(str(font_path) if font_path else None, font_size)
+        self.draw.text((x, y), text, fill=color, font=font)
+
+    def rectangle(
+        self,
+        x1: int,
+        y1: int,
+        x2: int,
+        y2: int,
+        fill: Optional[Tuple[int, int, int]] = None,
+        outline: Optional[Tuple[int, int, int]] = None,
+        width: int = 1
+    ) -> None:
+        """Draw a rectangle."""
+        # Solid axis-aligned fills take Pillow's block-fill primitive
+        # instead of the generic rectangle rasterizer
+        if fill is not None and outline is None:
+            self._fill_rect(x1, y1, x2, y2, fill)
+            return
+        self.draw.rectangle((x1, y1, x2, y2), fill=fill, outline=outline, width=width)
+
+    def circle(
+        self,
+        x: int,
+        y: int,
+        radius: int,
+        fill: Optional[Tuple[int, int, int]] = None,
+        outline: Optional[Tuple[int, int, int]] = None,
+        width: int = 1
+    ) -> None:
+        """Draw a circle."""
+        self.draw.ellipse((x - radius, y - radius, x + radius, y + radius),
+                          fill=fill, outline=outline, width=width)
+
+    def line(
+        self,
+        x1: int,
+        y1: int,
+        x2: int,
+        y2: int,
+        color: Optional[Tuple[int, int, int]] = None,
+        width: int = 1
+    ) -> None:
+        """Draw a line."""
+        if color is None:
+            color = self.COLOR_WHITE
+
+        # Single-pixel horizontal/vertical lines (separators, dividers)
+        # are the common case in UI chrome; they are one-pixel-tall or
+        # -wide rectangles, so take the block-fill primitive
+        if width == 1 and (x1 == x2 or y1 == y2):
+            self._fill_rect(
+                min(x1, x2), min(y1, y2),
+                max(x1, x2), max(y1, y2),
+                color
+            )
+            return
+
+        self.draw.line((x1, y1, x2, y2), fill=color, width=width)
+
+    def polygon(
+        self,
+        points: list,
+        fill: Optional[Tuple[int, int, int]] = None,
+        outline: Optional[Tuple[int, int, int]] = None,
+        width: int = 1
+    ) -> None:
+        """Draw a polygon from a list of (x, y) vertices."""
+        self.draw.polygon(points, fill=fill, outline=outline, width=width)
+
+    def image(
+        self,
+        image_path: Path,
+        x: int,
+        y: int,
+        width: Optional[int] = None,
+        height: Optional[int] = None
+    ) -> None:
+        """Draw an image from file."""
+        try:
+            mtime = Path(image_path).stat().st_mtime
+            img = _load_resized(str(image_path), width, height, mtime)
+            self.buffer.paste(img, (x, y))
+        except Exception as e:
+            logger.error(f"Failed to load image {image_path}: {e}")
+
+    def get_text_size(self, text: str, font_size: int = 16) -> Tuple[int, int]:
+        """Calculate rendered text dimensions."""
+        font = self._get_font(None, font_size)
+        bbox = self.draw.textbbox((0, 0), text, font=font)
+        return (bbox[2] - bbox[0], bbox[3] - bbox[1])
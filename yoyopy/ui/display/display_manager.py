@@ -15,9 +15,9 @@ Date: 2025-11-30
 """
 
 from yoyopy.ui.display.display_factory import get_display
+from contextlib import contextmanager
+
 from yoyopy.ui.display.display_hal import DisplayHAL
-from typing import Optional, Tuple
-from pathlib import Path
 
 
 class Display:
@@ -71,140 +71,55 @@ class Display:
         Raises:
             ValueError: If hardware type is unknown
         """
-        # Create appropriate adapter using factory
+        # Create appropriate adapter using factory. Everything else —
+        # drawing methods, geometry, COLOR_* constants, the simulate
+        # flag — is forwarded by __getattr__ below.
         self._adapter: DisplayHAL = get_display(hardware, simulate)
 
-        # Expose adapter properties as Display properties for backward compatibility
-        self.WIDTH = self._adapter.WIDTH
-        self.HEIGHT = self._adapter.HEIGHT
-        self.ORIENTATION = self._adapter.ORIENTATION
-        self.STATUS_BAR_HEIGHT = self._adapter.STATUS_BAR_HEIGHT
-
-        # Expose color constants
-        self.COLOR_BLACK = self._adapter.COLOR_BLACK
-        self.COLOR_WHITE = self._adapter.COLOR_WHITE
-        self.COLOR_RED = self._adapter.COLOR_RED
-        self.COLOR_GREEN = self._adapter.COLOR_GREEN
-        self.COLOR_BLUE = self._adapter.COLOR_BLUE
-        self.COLOR_YELLOW = self._adapter.COLOR_YELLOW
-        self.COLOR_CYAN = self._adapter.COLOR_CYAN
-        self.COLOR_MAGENTA = self._adapter.COLOR_MAGENTA
-        self.COLOR_GRAY = self._adapter.COLOR_GRAY
-        self.COLOR_DARK_GRAY = self._adapter.COLOR_DARK_GRAY
-
-        # Expose simulate flag for compatibility
-        self.simulate = self._adapter.simulate
-
-    # Delegate all methods to adapter
-    def clear(self, color: Optional[Tuple[int, int, int]] = None) -> None:
-        """Clear display with specified color."""
-        self._adapter.clear(color)
-
-    def text(
-        self,
-        text: str,
-        x: int,
-        y: int,
-        color: Optional[Tuple[int, int, int]] = None,
-        font_size: int = 16,
-        font_path: Optional[Path] = None
-    ) -> None:
-        """Draw text at specified position."""
-        self._adapter.text(text, x, y, color, font_size, font_path)
-
-    def rectangle(
-        self,
-        x1: int,
-        y1: int,
-        x2: int,
-        y2: int,
-        fill: Optional[Tuple[int, int, int]] = None,
-        outline: Optional[Tuple[int, int, int]] = None,
-        width: int = 1
-    ) -> None:
-        """Draw a rectangle."""
-        self._adapter.rectangle(x1, y1, x2, y2, fill, outline, width)
-
-    def circle(
-        self,
-        x: int,
-        y: int,
-        radius: int,
-        fill: Optional[Tuple[int, int, int]] = None,
-        outline: Optional[Tuple[int, int, int]] = None,
-        width: int = 1
-    ) -> None:
-        """Draw a circle."""
-        self._adapter.circle(x, y, radius, fill, outline, width)
-
-    def line(
-        self,
-        x1: int,
-        y1: int,
-        x2: int,
-        y2: int,
-        color: Optional[Tuple[int, int, int]] = None,
-        width: int = 1
-    ) -> None:
-        """Draw a line."""
-        self._adapter.line(x1, y1, x2, y2, color, width)
-
-    def image(
-        self,
-        image_path: Path,
-        x: int,
-        y: int,
-        width: Optional[int] = None,
-        height: Optional[int] = None
-    ) -> None:
-        """Draw an image from file."""
-        self._adapter.image(image_path, x, y, width, height)
-
-    def status_bar(
-        self,
-        time_str: str = "--:--",
-        battery_percent: int = 100,
-        signal_strength: int = 4
-    ) -> None:
-        """Draw status bar at top of screen."""
-        self._adapter.status_bar(time_str, battery_percent, signal_strength)
-
-    def update(self) -> None:
-        """Flush buffer to physical display."""
-        self._adapter.update()
-
-    def set_backlight(self, brightness: float) -> None:
-        """Set backlight brightness (0.0 to 1.0)."""
-        self._adapter.set_backlight(brightness)
-
-    def get_text_size(self, text: str, font_size: int = 16) -> Tuple[int, int]:
-        """Calculate rendered text dimensions."""
-        return self._adapter.get_text_size(text, font_size)
-
-    def cleanup(self) -> None:
-        """Cleanup display resources."""
-        self._adapter.cleanup()
-
-    # Helper methods
-    def is_portrait(self) -> bool:
-        """Check if display is in portrait orientation."""
-        return self._adapter.is_portrait()
-
-    def is_landscape(self) -> bool:
-        """Check if display is in landscape orientation."""
-        return self._adapter.is_landscape()
-
-    def get_orientation(self) -> str:
-        """Get display orientation."""
-        return self._adapter.get_orientation()
-
-    def get_dimensions(self) -> Tuple[int, int]:
-        """Get display dimensions (width, height)."""
-        return self._adapter.get_dimensions()
-
-    def get_usable_height(self) -> int:
-        """Get usable height excluding status bar."""
-        return self._adapter.get_usable_height()
+    def __getattr__(self, name: str):
+        """
+        Forward unknown attributes to the underlying adapter.
+
+        The facade no longer hand-copies the adapter's constants or
+        defines one-line forwarders for every drawing method: the first
+        access to e.g. ``display.rectangle`` or ``display.WIDTH``
+        resolves it from the adapter and caches the result on the
+        instance, so render-loop calls after the first bind directly to
+        the adapter's bound method with no facade frame in between.
+        """
+        try:
+            adapter = self.__dict__['_adapter']
+        except KeyError:
+            # Called before __init__ has run (e.g. during copying) —
+            # nothing to forward to yet
+            raise AttributeError(name)
+        attr = getattr(adapter, name)
+        self.__dict__[name] = attr
+        return attr
+
+    @contextmanager
+    def batch(self):
+        """
+        Draw a group of primitives with one flush at the end.
+
+        Yields the adapter itself, so every call inside the block goes
+        straight to the drawing primitive with no facade dispatch, and
+        update() runs exactly once on exit — one buffer flip for the
+        whole group:
+
+            with display.batch() as d:
+                d.clear()
+                d.rectangle(0, 0, 50, 50, fill=d.COLOR_RED)
+                d.text("hello", 5, 5)
+
+        A record-and-replay command buffer was considered instead, but
+        the adapters already share one persistent ImageDraw context and
+        Pillow has no bulk-draw entry point, so replaying would add a
+        tuple per primitive and then make the identical calls.
+        """
+        adapter = self._adapter
+        yield adapter
+        adapter.update()
 
     def get_adapter(self) -> DisplayHAL:
         """
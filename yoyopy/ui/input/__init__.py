@@ -6,11 +6,15 @@ Provides hardware abstraction for various input methods:
 - PTT button (Whisplay HAT)
 - Voice commands (future)
 - Touch screen (future)
+
+Submodules are imported lazily (PEP 562): importing the package itself
+pulls in nothing hardware-specific, and each name below is resolved from
+its submodule only on first attribute access. This keeps GPIO / pynput
+probing out of the import of anything that merely type-hints
+InputManager.
 """
 
-from yoyopy.ui.input.input_hal import InputHAL, InputAction
-from yoyopy.ui.input.input_manager import InputManager
-from yoyopy.ui.input.input_factory import get_input_manager
+import importlib
 
 __all__ = [
     'InputHAL',
@@ -18,3 +22,24 @@ __all__ = [
     'InputManager',
     'get_input_manager',
 ]
+
+# Name -> submodule that defines it; each attribute lives where its
+# import cost is (input_factory transitively imports every adapter)
+_LAZY_IMPORTS = {
+    'InputHAL': 'yoyopy.ui.input.input_hal',
+    'InputAction': 'yoyopy.ui.input.input_hal',
+    'InputManager': 'yoyopy.ui.input.input_manager',
+    'get_input_manager': 'yoyopy.ui.input.input_factory',
+}
+
+
+def __getattr__(name: str):
+    """Resolve public names from their submodules on first access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__ entirely
+    globals()[name] = value
+    return value
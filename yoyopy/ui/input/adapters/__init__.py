@@ -3,11 +3,14 @@ Input adapter implementations.
 
 Each adapter translates hardware-specific input (buttons, voice, touch)
 into semantic InputActions.
+
+Adapters are imported lazily (PEP 562): four_button probes for the
+DisplayHATMini library and keyboard for pynput, so eager imports here
+would pay every adapter's hardware-detection cost (and emit its "not
+available" warnings) even when only one adapter is ever used.
 """
 
-from yoyopy.ui.input.adapters.four_button import FourButtonInputAdapter
-from yoyopy.ui.input.adapters.ptt_button import PTTInputAdapter
-from yoyopy.ui.input.adapters.keyboard import KeyboardInputAdapter, get_keyboard_adapter
+import importlib
 
 __all__ = [
     'FourButtonInputAdapter',
@@ -15,3 +18,21 @@ __all__ = [
     'KeyboardInputAdapter',
     'get_keyboard_adapter',
 ]
+
+_LAZY_IMPORTS = {
+    'FourButtonInputAdapter': 'yoyopy.ui.input.adapters.four_button',
+    'PTTInputAdapter': 'yoyopy.ui.input.adapters.ptt_button',
+    'KeyboardInputAdapter': 'yoyopy.ui.input.adapters.keyboard',
+    'get_keyboard_adapter': 'yoyopy.ui.input.adapters.keyboard',
+}
+
+
+def __getattr__(name: str):
+    """Resolve adapter names from their submodules on first access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -19,7 +19,7 @@ from yoyopy.ui.screens.manager import ScreenManager
 from yoyopy.ui.screens.navigation import HomeScreen, MenuScreen
 
 # Music screens
-from yoyopy.ui.screens.music import NowPlayingScreen, PlaylistScreen
+from yoyopy.ui.screens.music import NowPlayingScreen, PlaylistScreen, AudioScreen
 
 # VoIP screens
 from yoyopy.ui.screens.voip import (
@@ -40,6 +40,7 @@ __all__ = [
     # Music
     'NowPlayingScreen',
     'PlaylistScreen',
+    'AudioScreen',
     # VoIP
     'CallScreen',
     'IncomingCallScreen',
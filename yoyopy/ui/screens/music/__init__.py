@@ -2,5 +2,6 @@
 
 from yoyopy.ui.screens.music.now_playing import NowPlayingScreen
 from yoyopy.ui.screens.music.playlist import PlaylistScreen
+from yoyopy.ui.screens.music.audio import AudioScreen
 
-__all__ = ['NowPlayingScreen', 'PlaylistScreen']
+__all__ = ['NowPlayingScreen', 'PlaylistScreen', 'AudioScreen']
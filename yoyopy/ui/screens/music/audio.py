@@ -0,0 +1,299 @@
+"""AudioScreen - Volume control and audio test screen."""
+
+import functools
+
+from yoyopy.ui.screens.base import Screen
+from yoyopy.ui.display import Display
+from pathlib import Path
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+from datetime import datetime
+from loguru import logger
+
+if TYPE_CHECKING:
+    from yoyopy.app_context import AppContext
+    from yoyopy.audio.audio_manager import AudioManager
+
+
+@functools.lru_cache(maxsize=1)
+def _find_test_sound() -> Optional[Path]:
+    """
+    Find a test sound file in the assets directory.
+
+    The assets directory is static for the process lifetime, so the
+    directory scan runs once and every AudioScreen instance reuses the
+    cached result.
+
+    Returns:
+        Path to a test sound, or None if none found
+    """
+    sounds_dir = Path("assets/sounds")
+    if not sounds_dir.exists():
+        return None
+
+    for pattern in ("*.wav", "*.mp3"):
+        sound = next(iter(sounds_dir.glob(pattern)), None)
+        if sound is not None:
+            return sound
+    return None
+
+
+class AudioScreen(Screen):
+    """
+    Audio screen for volume control and sound testing.
+
+    Displays the current volume with a colored level bar plus the active
+    audio device. Rendering is split into a static layer (status bar,
+    title, labels, device info, button hints) drawn once per visit and a
+    dynamic layer (volume number and bar fill) repainted only when the
+    volume actually changes, which keeps per-tick pixel writes small.
+
+    Button mapping:
+    - Button A: Play test sound
+    - Button B: Go back
+    - Button X: Volume up
+    - Button Y: Volume down
+    """
+
+    def __init__(
+        self,
+        display: Display,
+        audio_manager: 'AudioManager',
+        context: Optional['AppContext'] = None
+    ) -> None:
+        """
+        Initialize audio screen.
+
+        Args:
+            display: Display controller
+            audio_manager: AudioManager for volume control and playback
+            context: Application context
+        """
+        super().__init__(display, context, "Audio")
+        self.audio_manager = audio_manager
+        self.test_sound_path = _find_test_sound()
+
+        # Layout depends only on the fixed display geometry, so resolve
+        # the pixel positions once instead of per frame
+        self._title_y = display.STATUS_BAR_HEIGHT + 15
+        self._vol_y = display.STATUS_BAR_HEIGHT + 80
+        self._bar_x = 20
+        self._bar_y = self._vol_y + 70
+        self._bar_width = display.WIDTH - 40
+        self._bar_height = 20
+        self._device_y = display.HEIGHT - 60
+        self._hints_y = display.HEIGHT - 40
+
+        # Bounding box of the dynamic layer (volume number + bar), used
+        # for partial display refreshes on volume ticks
+        self._volume_region = (
+            self._bar_x,
+            self._vol_y,
+            self._bar_x + self._bar_width,
+            self._bar_y + self._bar_height,
+        )
+
+        # Volume-level color thresholds, highest first; colors live on
+        # the Display instance so the table is built here
+        self._vol_color_table: Tuple[Tuple[int, Tuple[int, int, int]], ...] = (
+            (70, display.COLOR_RED),
+            (40, display.COLOR_YELLOW),
+            (0, display.COLOR_GREEN),
+        )
+
+        # Dirty-region rendering state: static layer is drawn once per
+        # visit, volume ticks only repaint the number and bar fill
+        self._static_drawn: bool = False
+        self._last_volume: int = -1
+
+        # Text metrics involve font shaping in PIL, and this screen
+        # measures a small fixed vocabulary ("Audio Test", "0%".."100%"),
+        # so cache results per (text, font_size)
+        self._text_size_cache: Dict[Tuple[str, int], Tuple[int, int]] = {}
+
+    def _text_size(self, text: str, font_size: int) -> Tuple[int, int]:
+        """
+        Measure text with memoized results.
+
+        Args:
+            text: Text to measure
+            font_size: Font size in points
+
+        Returns:
+            (width, height) of the rendered text
+        """
+        key = (text, font_size)
+        size = self._text_size_cache.get(key)
+        if size is None:
+            size = self.display.get_text_size(text, font_size)
+            self._text_size_cache[key] = size
+        return size
+
+    def enter(self) -> None:
+        """Called when screen becomes active."""
+        super().enter()
+        # Other screens share the framebuffer, so the static layer must
+        # be repainted on every visit
+        self._static_drawn = False
+        self._last_volume = -1
+        self.render()
+
+    def render(self) -> None:
+        """Render the audio screen."""
+        volume = self.audio_manager.volume
+
+        if not self._static_drawn:
+            # Fresh visit: paint everything and flush the whole frame
+            self._render_static()
+            self._render_volume(volume)
+            self._static_drawn = True
+            self._last_volume = volume
+            self.display.update()
+        elif volume != self._last_volume:
+            # Volume tick: only the number and bar changed, so push just
+            # that region to the display
+            self._render_volume(volume)
+            self._last_volume = volume
+            self.display.update(self._volume_region)
+
+    def _render_static(self) -> None:
+        """Render the static layer: chrome that never changes per visit."""
+        # Clear display
+        self.display.clear(self.display.COLOR_BLACK)
+
+        # Draw status bar
+        current_time = datetime.now().strftime("%H:%M")
+        battery = self.context.battery_percent if self.context else 100
+        signal = self.context.signal_strength if self.context else 4
+
+        self.display.status_bar(
+            time_str=current_time,
+            battery_percent=battery,
+            signal_strength=signal
+        )
+
+        # Draw title
+        title = "Audio Test"
+        title_width, _ = self._text_size(title, 20)
+        title_x = (self.display.WIDTH - title_width) // 2
+        title_y = self._title_y
+
+        self.display.text(
+            title,
+            title_x,
+            title_y,
+            color=self.display.COLOR_WHITE,
+            font_size=20
+        )
+
+        # Draw "VOLUME" label
+        label = "VOLUME"
+        label_width, _ = self._text_size(label, 12)
+        label_x = (self.display.WIDTH - label_width) // 2
+        label_y = title_y + 40
+
+        self.display.text(
+            label,
+            label_x,
+            label_y,
+            color=self.display.COLOR_GRAY,
+            font_size=12
+        )
+
+        # Draw audio device info
+        device_info = self.audio_manager.get_device_info()
+        device_name = device_info.name if device_info else "No Device"
+
+        self.display.text(
+            f"Device: {device_name}",
+            20,
+            self._device_y,
+            color=self.display.COLOR_GRAY,
+            font_size=12
+        )
+
+        # Draw button hints
+        self.display.text(
+            "A: Test Sound  X/Y: Volume  B: Back",
+            20,
+            self._hints_y,
+            color=self.display.COLOR_DARK_GRAY,
+            font_size=12
+        )
+
+    def _render_volume(self, volume: int) -> None:
+        """
+        Render the dynamic layer: volume number and bar fill.
+
+        Args:
+            volume: Current volume (0-100)
+        """
+        vol_y = self._vol_y
+
+        # Clear the previous volume number with a black rectangle
+        self.display.rectangle(
+            self.display.WIDTH // 2 - 70, vol_y,
+            self.display.WIDTH // 2 + 70, vol_y + 55,
+            fill=self.display.COLOR_BLACK
+        )
+
+        # Draw volume percentage
+        volume_text = f"{volume}%"
+        volume_width, _ = self._text_size(volume_text, 48)
+        volume_x = (self.display.WIDTH - volume_width) // 2
+
+        self.display.text(
+            volume_text,
+            volume_x,
+            vol_y,
+            color=self.display.COLOR_WHITE,
+            font_size=48
+        )
+
+        # Draw volume bar
+        bar_x = self._bar_x
+        bar_y = self._bar_y
+
+        # Background
+        self.display.rectangle(
+            bar_x, bar_y,
+            bar_x + self._bar_width, bar_y + self._bar_height,
+            fill=self.display.COLOR_DARK_GRAY
+        )
+
+        # Fill, colored by level: first threshold at or below the volume wins
+        for threshold, fill_color in self._vol_color_table:
+            if volume > threshold or threshold == 0:
+                break
+
+        filled_width = int(self._bar_width * volume / 100)
+        if filled_width > 0:
+            self.display.rectangle(
+                bar_x, bar_y,
+                bar_x + filled_width, bar_y + self._bar_height,
+                fill=fill_color
+            )
+
+    # Button handlers
+    def on_button_a(self) -> None:
+        """Button A: Play test sound."""
+        if not self.test_sound_path:
+            logger.warning("No test sound available")
+            return
+
+        if self.audio_manager.load(self.test_sound_path):
+            self.audio_manager.play()
+
+    def on_button_b(self) -> None:
+        """Button B: Go back."""
+        if self.screen_manager:
+            self.screen_manager.pop_screen()
+
+    def on_button_x(self) -> None:
+        """Button X: Volume up."""
+        self.audio_manager.volume_up()
+        self.render()
+
+    def on_button_y(self) -> None:
+        """Button Y: Volume down."""
+        self.audio_manager.volume_down()
+        self.render()
@@ -64,7 +64,7 @@ class SimulationWebServer:
         self.running = False
         self.server_thread: Optional[threading.Thread] = None
         self.input_callback: Optional[Callable] = None
-        self.latest_display_data: str = ""
+        self.latest_display_data: bytes = b""
 
         # Setup routes
         self._setup_routes()
@@ -153,18 +153,25 @@ class SimulationWebServer:
         self.input_callback = callback
         logger.info("Input callback registered")
 
-    def send_display_update(self, image_data: str) -> None:
+    def send_display_update(self, image_data: bytes, full_frame: Optional[bytes] = None) -> None:
         """
         Send display update to all connected browsers.
 
+        The frame is forwarded as a binary WebSocket message, avoiding
+        the CPU cost of PNG encoding and the size overhead of base64.
+
         Args:
-            image_data: Base64-encoded PNG image data
+            image_data: Patch message: 8-byte (x, y, w, h) header
+                        followed by raw RGB888 bytes for that rectangle
+            full_frame: Optional full-frame message cached for clients
+                        that connect later; defaults to image_data when
+                        it already covers the whole display
 
         Example:
-            >>> png_base64 = "iVBORw0KGgoAAAANS..."
-            >>> server.send_display_update(png_base64)
+            >>> frame = adapter.buffer.tobytes()
+            >>> server.send_display_update(header + frame)
         """
-        self.latest_display_data = image_data
+        self.latest_display_data = full_frame if full_frame is not None else image_data
 
         if self.running:
             try:
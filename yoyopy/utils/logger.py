@@ -65,6 +65,34 @@ def init_logger(
     logger.info(f"Logger initialized with level: {level}")
 
 
+def debug_enabled() -> bool:
+    """
+    Check whether any sink will actually record DEBUG messages.
+
+    Loguru formats messages eagerly, so hot paths (per-line subprocess
+    output, polling loops) should guard their debug calls on this to
+    avoid building the log string when debug logging is disabled.
+
+    Returns:
+        True if a DEBUG-level sink is active
+    """
+    return logger._core.min_level <= 10
+
+
+def info_enabled() -> bool:
+    """
+    Check whether any sink will actually record INFO messages.
+
+    Same rationale as debug_enabled(): per-transition and per-event
+    INFO logs in hot paths should not pay for string formatting when
+    every sink is filtered above INFO.
+
+    Returns:
+        True if an INFO-level sink is active
+    """
+    return logger._core.min_level <= 20
+
+
 def get_logger():
     """
     Get the loguru logger instance.